@@ -1,3 +1,343 @@
+# import OrderedDict to keep the order queue in FIFO order with O(1) lookup by order number
+# import json, mmap and os modules to write and recover the optional journal and snapshot files
+# import asyncio and inspect modules to run the asynchronous order server front-end
+# import multiprocessing and zlib modules to run hash-partitioned shards in worker processes
+# import array module to store interned item codes compactly
+# import islice to read cursor pages straight from the live containers
+# import heapq module to schedule queued orders across parallel serving stations
+import asyncio
+import heapq
+import inspect
+import json
+import mmap
+import multiprocessing
+import os
+import zlib
+from array import array
+from collections import OrderedDict
+from itertools import islice
+
+
+class _FenwickTree:
+    """
+    Binary indexed tree over order queue positions (1-based).
+    Keeps item counts per position so prefix sums and point updates cost O(log n).
+    """
+
+    def __init__(self, values=()):
+        """
+        Builds the tree in O(n) from the item counts of positions 1, 2, ..., n.
+
+        Parameters:
+        - values (iterable): Item count stored at each position, in queue order.
+        """
+        self.__tree = [0]
+        self.__tree.extend(values)
+        size = len(self.__tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                self.__tree[parent] += self.__tree[i]
+
+    def __len__(self):
+        """
+        Returns:
+        - int: The number of positions ever allocated in the tree.
+        """
+        return len(self.__tree) - 1
+
+    def append(self, value):
+        """
+        Allocates the next position with the given value.
+
+        Parameters:
+        - value (int): Item count stored at the new position.
+
+        Returns:
+        - int: The new position.
+        """
+        position = len(self.__tree)
+        low = position - (position & -position)
+        self.__tree.append(value + self.prefixSum(position - 1) - self.prefixSum(low))
+        return position
+
+    def add(self, position, delta):
+        """
+        Adds delta to the value stored at a position.
+
+        Parameters:
+        - position (int): Position to update.
+        - delta (int): Amount to add.
+        """
+        size = len(self.__tree)
+        while position < size:
+            self.__tree[position] += delta
+            position += position & -position
+
+    def prefixSum(self, position):
+        """
+        Sums the values of positions 1 to position.
+
+        Parameters:
+        - position (int): Last position to include.
+
+        Returns:
+        - int: The prefix sum.
+        """
+        total = 0
+        while position > 0:
+            total += self.__tree[position]
+            position -= position & -position
+        return total
+
+
+class _Order:
+    """
+    Queued order record. __slots__ keeps each order to a single small object.
+    - order_num: Unique order identifier.
+    - items: List of item names, or array('I') of interned item codes in compact mode.
+    - position: Position of the order in the item index.
+    - customer_id: ID of the registered customer who placed the order, or None.
+    """
+
+    __slots__ = ("order_num", "items", "position", "customer_id")
+
+    def __init__(self, order_num, items, position=0, customer_id=None):
+        self.order_num = order_num
+        self.items = items
+        self.position = position
+        self.customer_id = customer_id
+
+
+class _PageCursor:
+    """
+    Read-only cursor that pages through a live container without copying it.
+    The cursor remembers the container's generation when it is created and stops
+    handing out pages once a mutation has changed that generation.
+    """
+
+    def __init__(self, records, export, page_size, generation_of):
+        """
+        Parameters:
+        - records (iterable): The live records to page through.
+        - export (callable): Converts one record to its detached, public form.
+        - page_size (int): Maximum number of records per page.
+        - generation_of (callable): Returns the container's current generation.
+        """
+        self.__records = iter(records)
+        self.__export = export
+        self.__page_size = page_size
+        self.__generation_of = generation_of
+        self.__generation = generation_of()
+
+    def isValid(self):
+        """
+        Returns:
+        - bool: True if the container has not changed since the cursor was created.
+        """
+        return self.__generation_of() == self.__generation
+
+    def nextPage(self):
+        """
+        Reads the next page of records.
+
+        Returns:
+        - list: Up to page_size exported records; empty once the cursor is exhausted.
+        - int: -1 if the container was modified after the cursor was created.
+        """
+        if not self.isValid():
+            return -1
+        return list(map(self.__export, islice(self.__records, self.__page_size)))
+
+    def __iter__(self):
+        """
+        Yields pages until the cursor is exhausted.
+
+        Raises:
+        - RuntimeError: If the container is modified while iterating.
+        """
+        while True:
+            page = self.nextPage()
+            if page == -1:
+                raise RuntimeError("container changed during cursor iteration")
+            if not page:
+                return
+            yield page
+
+
+class _OrderJournal:
+    """
+    Append-only journal plus compact snapshot files kept in one directory.
+    Journal records are JSON lines handed to the OS as they are appended, so they survive a crash of the process,
+    and fsynced in groups, so a power loss can only lose the last group.
+    Each snapshot starts a new journal generation, so recovery replays only the records written after it.
+    """
+
+    SNAPSHOT_NAME = "snapshot.json"
+
+    def __init__(self, directory, group_commit):
+        """
+        Prepares the journal directory. Call readSnapshot, replay and then open before appending.
+
+        Parameters:
+        - directory (str): Directory holding the snapshot and journal files.
+        - group_commit (int): Number of records appended between fsync calls.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__group_commit = group_commit
+        self.__generation = 0
+        self.__valid_size = 0
+        self.__pending = 0
+        self.__records = 0
+        self.__file = None
+
+    def __logPath(self, generation=None):
+        """
+        Returns:
+        - str: Path of the journal file for a generation (the current one by default).
+        """
+        generation = self.__generation if generation is None else generation
+        return os.path.join(self.__directory, f"journal.{generation}.log")
+
+    def readSnapshot(self):
+        """
+        Loads the latest snapshot and selects the journal generation that follows it.
+
+        Returns:
+        - dict: {'generation': int, 'customers': [[customer_id, customer_name], ...],
+          'orders': [[order_num, order_items, customer_id], ...]}.
+        - None: If no snapshot has been written yet.
+        """
+        path = os.path.join(self.__directory, self.SNAPSHOT_NAME)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as file:
+            snapshot = json.load(file)
+        self.__generation = snapshot["generation"]
+        return snapshot
+
+    def replay(self):
+        """
+        Yields the records of the current journal generation through a memory-mapped read.
+        A torn record at the end of the file (from a crash mid-write) is skipped and truncated by open.
+        So is everything from the first line that is not a valid record, such as a zero-filled tail left by a power loss.
+
+        Yields:
+        - list: One journal record, [operation, arguments...].
+        """
+        self.__valid_size = 0
+        path = self.__logPath()
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = len(data)
+            start = 0
+            while start < end:
+                newline = data.find(b"\n", start)
+                if newline == -1:
+                    break
+                try:
+                    record = json.loads(data[start:newline])
+                except ValueError:
+                    break
+                if not isinstance(record, list) or not record:
+                    break
+                start = newline + 1
+                self.__valid_size = start
+                self.__records += 1
+                yield record
+
+    def open(self):
+        """
+        Opens the current journal generation for appending and removes journals of older generations.
+        """
+        path = self.__logPath()
+        if os.path.exists(path) and os.path.getsize(path) > self.__valid_size:
+            os.truncate(path, self.__valid_size)
+        self.__file = open(path, "ab", buffering=0)
+        for name in os.listdir(self.__directory):
+            if name.startswith("journal.") and name != os.path.basename(path):
+                os.remove(os.path.join(self.__directory, name))
+
+    def encode(self, record):
+        """
+        Serializes a record for append. Raises TypeError or ValueError if it cannot be written as JSON.
+
+        Parameters:
+        - record (list or tuple): [operation, arguments...].
+
+        Returns:
+        - bytes: The encoded journal line.
+        """
+        return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    def append(self, line):
+        """
+        Writes one encoded record straight to the OS, fsyncing once group_commit records are pending.
+
+        Parameters:
+        - line (bytes): A record returned by encode.
+        """
+        self.__file.write(line)
+        self.__pending += 1
+        self.__records += 1
+        if self.__pending >= self.__group_commit:
+            self.sync()
+
+    def recordCount(self):
+        """
+        Returns:
+        - int: The number of records in the current journal generation.
+        """
+        return self.__records
+
+    def sync(self):
+        """
+        Fsyncs the records appended since the last sync.
+        """
+        if self.__pending:
+            os.fsync(self.__file.fileno())
+            self.__pending = 0
+
+    def writeSnapshot(self, customers, orders):
+        """
+        Atomically writes a snapshot of the full state and starts a new, empty journal generation.
+
+        Parameters:
+        - customers (list): [customer_id, customer_name] pairs.
+        - orders (list): [order_num, order_items, customer_id] records in queue order.
+        """
+        generation = self.__generation + 1
+        path = os.path.join(self.__directory, self.SNAPSHOT_NAME)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"generation": generation, "customers": customers, "orders": orders}, file, separators=(",", ":"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+        if hasattr(os, "O_DIRECTORY"):
+            directory_fd = os.open(self.__directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(directory_fd)
+            finally:
+                os.close(directory_fd)
+
+        self.__file.close()
+        self.__generation = generation
+        self.__valid_size = 0
+        self.__pending = 0
+        self.__records = 0
+        self.open()
+
+    def close(self):
+        """
+        Fsyncs pending records and closes the journal file.
+        """
+        self.sync()
+        self.__file.close()
+
+
 class DatabaseServerManager:
     """
     Class making practice: Managing customer data and order handling.
@@ -5,15 +345,145 @@ class DatabaseServerManager:
     Allows customer registration, order management, and database queries.
     """
 
-    def __init__(self):
+    def __init__(self, journal_dir=None, group_commit=64, snapshot_every=100000, compact=False):
         """
         Initializes the OrderDatabaseManager with separate modules for customer database and order server.
+
+        Parameters:
+        - journal_dir (str, optional): Directory for the append-only journal and snapshots. If given, the previous
+          state is recovered from it and every mutation is journaled. Defaults to None (in-memory only).
+        - group_commit (int, optional): Journal records written between fsync calls. Defaults to 64.
+        - snapshot_every (int, optional): Journal records written between automatic snapshots. Defaults to 100000.
+        - compact (bool, optional): If True, item names are interned into a string table and each order stores
+          its items as array('I') codes. Methods still return [order_num, order_items] lists. Defaults to False.
+
         Attributes:
         - __customer_db: A private dictionary to store customer data (customer ID -> customer name).
-        - __order_server: A private list to manage orders (order number, order items).
+        - __order_server: A private ordered dictionary to manage orders in FIFO order (order number -> _Order).
+        - __item_names / __item_codes: Private string table used in compact mode (code -> name, name -> code).
+        - __customer_orders: A private dictionary linking customers to their queued orders
+          (customer ID -> {order number: None}, in queue order).
+        - __customer_generation / __order_generation: Private counters bumped on every customer or order
+          mutation, used by cursors to detect concurrent modification.
+        - __item_index: A private Fenwick tree of item counts by queue position, used for waiting times.
+        - __total_items: A private running count of items across all queued orders.
+        - __name_index: A private dictionary mapping each customer name to the ids using it (name -> {customer ID: None}).
+        - __duplicate_names: A private dictionary used as an ordered set of names shared by two or more customers.
+        - __journal: A private _OrderJournal, or None when persistence is disabled.
+        Item lists must be changed through addServiceToOrder so the item index and journal stay in sync.
         """
         self.__customer_db = {}
-        self.__order_server = []
+        self.__name_index = {}
+        self.__duplicate_names = {}
+        self.__order_server = OrderedDict()
+        self.__compact = compact
+        self.__item_names = []
+        self.__item_codes = {}
+        self.__customer_orders = {}
+        self.__customer_generation = 0
+        self.__order_generation = 0
+        self.__item_index = _FenwickTree()
+        self.__total_items = 0
+        self.__journal = None
+        self.__snapshot_every = snapshot_every
+        if journal_dir is not None:
+            self.__recover(_OrderJournal(journal_dir, group_commit))
+
+    def __recover(self, journal):
+        """
+        Rebuilds the state from the latest snapshot and the journal written after it, then enables journaling.
+
+        Parameters:
+        - journal (_OrderJournal): The journal to recover from.
+        """
+        snapshot = journal.readSnapshot()
+        if snapshot is not None:
+            self.registerCustomers(snapshot["customers"])
+            self.makeOrders(snapshot["orders"])
+
+        operations = {
+            "register": self.registerCustomer,
+            "order": self.makeOrder,
+            "cancel": self.cancelOrder,
+            "serve": self.serveNextOrder,
+            "service": self.addServiceToOrder,
+            "rename": self.updateCustomerName,
+            "remove": self.removeCustomer,
+        }
+        for record in journal.replay():
+            operations[record[0]](*record[1:])
+        journal.open()
+        self.__journal = journal
+
+    def __encode(self, *record):
+        """
+        Serializes a journal record before its mutation is applied, so a record that cannot be journaled
+        (e.g. an item that is not JSON-serializable) raises TypeError or ValueError and changes nothing.
+
+        Parameters:
+        - record: Operation name followed by its arguments.
+
+        Returns:
+        - bytes: The encoded record.
+        - None: If persistence is disabled.
+        """
+        if self.__journal is None:
+            return None
+        return self.__journal.encode(record)
+
+    def __log(self, line):
+        """
+        Journals a successful mutation and takes a snapshot when one is due.
+
+        Parameters:
+        - line (bytes or None): The record returned by __encode.
+        """
+        if line is None:
+            return
+        self.__journal.append(line)
+        self.__checkpointIfDue()
+
+    def __checkpointIfDue(self):
+        """
+        Takes a snapshot once snapshot_every records have been journaled since the last one.
+        """
+        if self.__journal is not None and self.__journal.recordCount() >= self.__snapshot_every:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """
+        Writes a compact snapshot of all customers and queued orders and starts a new journal.
+
+        Returns:
+        - int: 1 if the snapshot was written.
+        - int: -1 if persistence is disabled.
+        """
+        if self.__journal is None:
+            return -1
+        orders = [self.__exportOrder(order) + [order.customer_id] for order in self.__order_server.values()]
+        self.__journal.writeSnapshot(list(self.__customer_db.items()), orders)
+        return 1
+
+    def syncJournal(self):
+        """
+        Forces journaled records that are still waiting for a group commit to disk.
+
+        Returns:
+        - int: 1 if the journal was synced.
+        - int: -1 if persistence is disabled.
+        """
+        if self.__journal is None:
+            return -1
+        self.__journal.sync()
+        return 1
+
+    def close(self):
+        """
+        Syncs and closes the journal. The manager stays usable in memory, without persistence.
+        """
+        if self.__journal is not None:
+            self.__journal.close()
+            self.__journal = None
 
     def registerCustomer(self, customer_id, customer_name):
         """
@@ -29,9 +499,70 @@ class DatabaseServerManager:
         """
         if customer_id in self.__customer_db:
             return -1
+        line = self.__encode("register", customer_id, customer_name)
         self.__customer_db[customer_id] = customer_name
+        self.__indexName(customer_id, customer_name)
+        self.__customer_generation += 1
+        self.__log(line)
         return {customer_id: customer_name}
 
+    def registerCustomers(self, customers):
+        """
+        Registers many customers in one pass.
+
+        Parameters:
+        - customers (iterable): (customer_id, customer_name) pairs; any iterable or generator.
+
+        Returns:
+        - list: Customer IDs that were rejected because they already exist, in input order.
+        """
+        customer_db = self.__customer_db
+        index_name = self.__indexName
+        journal = self.__journal
+        rejected = []
+        try:
+            for customer_id, customer_name in customers:
+                if customer_id in customer_db:
+                    rejected.append(customer_id)
+                    continue
+                line = journal.encode(("register", customer_id, customer_name)) if journal is not None else None
+                customer_db[customer_id] = customer_name
+                index_name(customer_id, customer_name)
+                if line is not None:
+                    journal.append(line)
+        finally:
+            self.__customer_generation += 1
+            self.__checkpointIfDue()
+        return rejected
+
+    def __indexName(self, customer_id, customer_name):
+        """
+        Adds a customer to the name index.
+
+        Parameters:
+        - customer_id (str): Unique identifier for the customer.
+        - customer_name (str): Name of the customer.
+        """
+        customer_ids = self.__name_index.setdefault(customer_name, {})
+        customer_ids[customer_id] = None
+        if len(customer_ids) == 2:
+            self.__duplicate_names[customer_name] = None
+
+    def __unindexName(self, customer_id, customer_name):
+        """
+        Removes a customer from the name index.
+
+        Parameters:
+        - customer_id (str): Unique identifier for the customer.
+        - customer_name (str): Name the customer is currently indexed under.
+        """
+        customer_ids = self.__name_index[customer_name]
+        del customer_ids[customer_id]
+        if len(customer_ids) == 1:
+            del self.__duplicate_names[customer_name]
+        elif not customer_ids:
+            del self.__name_index[customer_name]
+
     def getCustomerByID(self, customer_id):
         """
         Retrieves customer name by their ID.
@@ -47,24 +578,148 @@ class DatabaseServerManager:
             return -1
         return {customer_id: self.__customer_db[customer_id]}
 
-    def makeOrder(self, order_num, order_list):
+    def getCustomersByName(self, customer_name):
+        """
+        Retrieves all customers registered under a given name.
+
+        Parameters:
+        - customer_name (str): Name to search for.
+
+        Returns:
+        - dict: {customer_id: customer_name} for every customer with that name.
+        - int: -1 if no customer has that name.
+        """
+        if customer_name not in self.__name_index:
+            return -1
+        return {cid: customer_name for cid in self.__name_index[customer_name]}
+
+    def makeOrder(self, order_num, order_list, customer_id=None):
         """
         Places a new order in the server queue.
 
         Parameters:
         - order_num (str): Unique order identifier.
         - order_list (list): List of items in the order.
+        - customer_id (str, optional): Registered customer placing the order. Defaults to None (no customer link).
 
         Returns:
         - list: [order_num, order_list] if the order is successfully added.
         - int: -1 if the order number already exists.
+        - int: -2 if customer_id is given but not registered.
         """
-        for order in self.__order_server:
-            if order[0] == order_num:
-                return -1
-        new_order = [order_num, order_list]
-        self.__order_server.append(new_order)
-        return new_order
+        if order_num in self.__order_server:
+            return -1
+        if customer_id is not None and customer_id not in self.__customer_db:
+            return -2
+        line = self.__encode("order", order_num, order_list, customer_id)
+        new_order = _Order(order_num, self.__storeItems(order_list), self.__item_index.append(len(order_list)), customer_id)
+        self.__order_server[order_num] = new_order
+        self.__linkCustomerOrder(new_order)
+        self.__total_items += len(order_list)
+        self.__order_generation += 1
+        self.__log(line)
+        return self.__exportOrder(new_order)
+
+    def __linkCustomerOrder(self, order):
+        """
+        Adds an order to its customer's entry in the customer -> orders index.
+
+        Parameters:
+        - order (_Order): The newly queued order.
+        """
+        if order.customer_id is not None:
+            self.__customer_orders.setdefault(order.customer_id, {})[order.order_num] = None
+
+    def __unlinkCustomerOrder(self, order):
+        """
+        Removes an order that left the queue from the customer -> orders index.
+
+        Parameters:
+        - order (_Order): The dequeued order.
+        """
+        if order.customer_id is None:
+            return
+        customer_orders = self.__customer_orders[order.customer_id]
+        del customer_orders[order.order_num]
+        if not customer_orders:
+            del self.__customer_orders[order.customer_id]
+
+    def __storeItems(self, order_list):
+        """
+        Converts an item list to its stored form: the list itself, or array('I') codes in compact mode.
+
+        Parameters:
+        - order_list (list): List of item names.
+
+        Returns:
+        - list or array: The items to keep in the _Order record.
+        """
+        if not self.__compact:
+            return order_list
+        item_codes = self.__item_codes
+        for item in order_list:
+            if item not in item_codes:
+                item_codes[item] = len(self.__item_names)
+                self.__item_names.append(item)
+        return array('I', [item_codes[item] for item in order_list])
+
+    def __exportOrder(self, order):
+        """
+        Converts a stored order to the public [order_num, order_items] shape.
+
+        Parameters:
+        - order (_Order): The stored order.
+
+        Returns:
+        - list: [order_num, order_items].
+        """
+        if not self.__compact:
+            return [order.order_num, order.items]
+        return [order.order_num, list(map(self.__item_names.__getitem__, order.items))]
+
+    def makeOrders(self, orders):
+        """
+        Places many orders at the end of the server queue in one pass.
+
+        Parameters:
+        - orders (iterable): (order_num, order_list) pairs or (order_num, order_list, customer_id) triples;
+          any iterable or generator.
+
+        Returns:
+        - list: Order numbers that were rejected because they already exist or name an unregistered customer,
+          in input order.
+        """
+        order_server = self.__order_server
+        customer_db = self.__customer_db
+        journal = self.__journal
+        queued_before = len(order_server)
+        accepted = []
+        rejected = []
+        try:
+            for record in orders:
+                order_num, order_list = record[0], record[1]
+                customer_id = record[2] if len(record) > 2 else None
+                if order_num in order_server or (customer_id is not None and customer_id not in customer_db):
+                    rejected.append(order_num)
+                    continue
+                line = journal.encode(("order", order_num, order_list, customer_id)) if journal is not None else None
+                new_order = order_server[order_num] = _Order(order_num, self.__storeItems(order_list), 0, customer_id)
+                self.__linkCustomerOrder(new_order)
+                accepted.append(order_num)
+                self.__total_items += len(order_list)
+                if line is not None:
+                    journal.append(line)
+        finally:
+            # index the orders queued so far even if a record could not be journaled
+            if len(accepted) >= queued_before:
+                self.__rebuildItemIndex()
+            else:
+                for order_num in accepted:
+                    order = order_server[order_num]
+                    order.position = self.__item_index.append(len(order.items))
+            self.__order_generation += 1
+            self.__checkpointIfDue()
+        return rejected
 
     def cancelOrder(self, order_num):
         """
@@ -77,11 +732,14 @@ class DatabaseServerManager:
         - list: [order_num, order_items] if the order is successfully removed.
         - int: -1 if the order is not found.
         """
-        for order in self.__order_server:
-            if order[0] == order_num:
-                self.__order_server.remove(order)
-                return order
-        return -1
+        if order_num not in self.__order_server:
+            return -1
+        line = self.__encode("cancel", order_num)
+        order = self.__order_server.pop(order_num)
+        self.__releasePosition(order)
+        self.__order_generation += 1
+        self.__log(line)
+        return self.__exportOrder(order)
 
     def getOrderCount(self):
         """
@@ -102,7 +760,34 @@ class DatabaseServerManager:
         """
         if not self.__order_server:
             return -1
-        return self.__order_server.pop(0)
+        line = self.__encode("serve")
+        order = self.__order_server.popitem(last=False)[1]
+        self.__releasePosition(order)
+        self.__order_generation += 1
+        self.__log(line)
+        return self.__exportOrder(order)
+
+    def __releasePosition(self, order):
+        """
+        Removes a dequeued order from the item index.
+        Renumbers the remaining positions once most allocated positions are empty, keeping the index O(n) in size.
+
+        Parameters:
+        - order (_Order): The order that left the queue.
+        """
+        self.__item_index.add(order.position, -len(order.items))
+        self.__total_items -= len(order.items)
+        self.__unlinkCustomerOrder(order)
+        if len(self.__item_index) > 2 * len(self.__order_server) + 64:
+            self.__rebuildItemIndex()
+
+    def __rebuildItemIndex(self):
+        """
+        Renumbers queued orders to positions 1..n and rebuilds the item index in O(n).
+        """
+        for position, order in enumerate(self.__order_server.values(), 1):
+            order.position = position
+        self.__item_index = _FenwickTree(len(order.items) for order in self.__order_server.values())
 
     def getCustomerOrders(self):
         """
@@ -111,7 +796,99 @@ class DatabaseServerManager:
         Returns:
         - list: List of all active orders in the queue.
         """
-        return self.__order_server
+        return list(map(self.__exportOrder, self.__order_server.values()))
+
+    def getOrderCursor(self, page_size=1000):
+        """
+        Opens a read-only cursor over the queued orders, in queue order, without copying the queue.
+        The cursor stops handing out pages once any order is placed, cancelled, served or changed.
+
+        Parameters:
+        - page_size (int, optional): Maximum number of orders per page. Defaults to 1000.
+
+        Returns:
+        - _PageCursor: Cursor whose pages are lists of detached [order_num, order_items].
+        """
+        return _PageCursor(self.__order_server.values(), self.__copyOrder, page_size, lambda: self.__order_generation)
+
+    def __copyOrder(self, order):
+        """
+        Converts a stored order to a detached [order_num, order_items] list that shares nothing with the queue.
+
+        Parameters:
+        - order (_Order): The stored order.
+
+        Returns:
+        - list: [order_num, order_items].
+        """
+        new_order = self.__exportOrder(order)
+        if not self.__compact:
+            new_order[1] = list(new_order[1])
+        return new_order
+
+    def getCustomerCursor(self, page_size=1000):
+        """
+        Opens a read-only cursor over the customers, in registration order, without copying the database.
+        The cursor stops handing out pages once any customer is registered, renamed or removed.
+
+        Parameters:
+        - page_size (int, optional): Maximum number of customers per page. Defaults to 1000.
+
+        Returns:
+        - _PageCursor: Cursor whose pages are lists of (customer_id, customer_name) pairs.
+        """
+        return _PageCursor(self.__customer_db.items(), tuple, page_size, lambda: self.__customer_generation)
+
+    def getOrdersByCustomer(self, customer_id):
+        """
+        Retrieves the queued orders placed by a customer, in queue order.
+
+        Parameters:
+        - customer_id (str): Unique identifier for the customer.
+
+        Returns:
+        - list: [order_num, order_items] for each of the customer's queued orders (empty if none).
+        - int: -1 if the customer ID is not found.
+        """
+        if customer_id not in self.__customer_db:
+            return -1
+        order_server = self.__order_server
+        return [self.__exportOrder(order_server[order_num]) for order_num in self.__customer_orders.get(customer_id, ())]
+
+    def getCustomerItemTotal(self, customer_id):
+        """
+        Counts the items across a customer's queued orders.
+
+        Parameters:
+        - customer_id (str): Unique identifier for the customer.
+
+        Returns:
+        - int: The total count of items in the customer's orders.
+        - int: -1 if the customer ID is not found.
+        """
+        if customer_id not in self.__customer_db:
+            return -1
+        order_server = self.__order_server
+        return sum(len(order_server[order_num].items) for order_num in self.__customer_orders.get(customer_id, ()))
+
+    def getCustomerWaitingTimes(self, customer_id, prod_time):
+        """
+        Calculates the waiting time of each of a customer's queued orders.
+
+        Parameters:
+        - customer_id (str): Unique identifier for the customer.
+        - prod_time (int): Production time per item.
+
+        Returns:
+        - list: [{'order_num': 'O1', 'waiting_time': 6}, ...] in queue order.
+        - int: -1 if the customer ID is not found.
+        """
+        if customer_id not in self.__customer_db:
+            return -1
+        order_server = self.__order_server
+        prefix_sum = self.__item_index.prefixSum
+        return [{'order_num': order_num, 'waiting_time': prefix_sum(order_server[order_num].position) * prod_time}
+                for order_num in self.__customer_orders.get(customer_id, ())]
 
     def getCustomerList(self):
         """
@@ -134,12 +911,10 @@ class DatabaseServerManager:
         - int: The total waiting time for the order.
         - int: -1 if the order is not found.
         """
-        waiting_time = 0
-        for order in self.__order_server:
-            if order[0] == order_num:
-                return waiting_time + len(order[1]) * prod_time
-            waiting_time += len(order[1]) * prod_time
-        return -1
+        order = self.__order_server.get(order_num)
+        if order is None:
+            return -1
+        return self.__item_index.prefixSum(order.position) * prod_time
 
     def getDuplicateCustomerNames(self):
         """
@@ -148,11 +923,10 @@ class DatabaseServerManager:
         Returns:
         - dict: Dictionary of {customer_id: customer_name} for customers with duplicate names.
         """
-        name_count = {}
-        for name in self.__customer_db.values():
-            name_count[name] = name_count.get(name, 0) + 1
-
-        duplicates = {cid: cname for cid, cname in self.__customer_db.items() if name_count[cname] > 1}
+        duplicates = {}
+        for cname in self.__duplicate_names:
+            for cid in self.__name_index[cname]:
+                duplicates[cid] = cname
         return duplicates
 
     def addServiceToOrder(self, order_num, service):
@@ -167,11 +941,16 @@ class DatabaseServerManager:
         - list: [order_num, updated_order_items] if the order is found.
         - int: -1 if the order is not found.
         """
-        for order in self.__order_server:
-            if order[0] == order_num:
-                order[1].append(service)
-                return order
-        return -1
+        order = self.__order_server.get(order_num)
+        if order is None:
+            return -1
+        line = self.__encode("service", order_num, service)
+        order.items.extend(self.__storeItems([service]))
+        self.__item_index.add(order.position, 1)
+        self.__total_items += 1
+        self.__order_generation += 1
+        self.__log(line)
+        return self.__exportOrder(order)
 
     def updateCustomerName(self, customer_id, new_name):
         """
@@ -187,7 +966,12 @@ class DatabaseServerManager:
         """
         if customer_id not in self.__customer_db:
             return -1
+        line = self.__encode("rename", customer_id, new_name)
+        self.__unindexName(customer_id, self.__customer_db[customer_id])
         self.__customer_db[customer_id] = new_name
+        self.__indexName(customer_id, new_name)
+        self.__customer_generation += 1
+        self.__log(line)
         return {customer_id: new_name}
 
     def getOrderDetails(self, order_num):
@@ -201,17 +985,19 @@ class DatabaseServerManager:
         - list: [order_num, order_items] if the order exists.
         - int: -1 if the order is not found.
         """
-        for order in self.__order_server:
-            if order[0] == order_num:
-                return order
-        return -1
+        order = self.__order_server.get(order_num)
+        if order is None:
+            return -1
+        return self.__exportOrder(order)
 
-    def removeCustomer(self, customer_id):
+    def removeCustomer(self, customer_id, cascade=False):
         """
         Removes a customer from the database.
 
         Parameters:
         - customer_id (str): Unique identifier for the customer.
+        - cascade (bool, optional): If True, the customer's queued orders are cancelled too. Otherwise they
+          stay queued without a customer link. Defaults to False.
 
         Returns:
         - dict: {customer_id: customer_name} if the removal is successful.
@@ -219,7 +1005,16 @@ class DatabaseServerManager:
         """
         if customer_id not in self.__customer_db:
             return -1
+        line = self.__encode("remove", customer_id)
+        if cascade:
+            for order_num in list(self.__customer_orders.get(customer_id, ())):
+                self.cancelOrder(order_num)
+        for order_num in self.__customer_orders.pop(customer_id, ()):
+            self.__order_server[order_num].customer_id = None
         removed_customer = {customer_id: self.__customer_db.pop(customer_id)}
+        self.__unindexName(customer_id, removed_customer[customer_id])
+        self.__customer_generation += 1
+        self.__log(line)
         return removed_customer
 
     def calculateTotalItems(self):
@@ -229,10 +1024,7 @@ class DatabaseServerManager:
         Returns:
         - int: The total count of items in all orders.
         """
-        total_items = 0
-        for order in self.__order_server:
-            total_items += len(order[1])
-        return total_items
+        return self.__total_items
 
     def getOrderSummary(self):
         """
@@ -243,6 +1035,552 @@ class DatabaseServerManager:
         Example: [{'order_num': 'O1', 'item_count': 3}, ...]
         """
         summary = []
-        for order in self.__order_server:
-            summary.append({'order_num': order[0], 'item_count': len(order[1])})
+        for order in self.__order_server.values():
+            summary.append({'order_num': order.order_num, 'item_count': len(order.items)})
         return summary
+
+    def estimateCompletionTimes(self, station_times):
+        """
+        Simulates serving the whole queue on parallel stations and estimates when each order is finished.
+        Orders are taken in queue order; each goes to the station that becomes free first (lowest index on ties).
+        With a single station this matches getWaitingTime for every order. Runs in O(n log K) for K stations.
+
+        Parameters:
+        - station_times (list): Production time per item for each station.
+
+        Returns:
+        - list: List of dictionaries in queue order.
+        Example: [{'order_num': 'O1', 'station': 0, 'completion_time': 6}, ...]
+        - int: -1 if no stations are given.
+        """
+        if not station_times:
+            return -1
+        stations = [(0, index) for index in range(len(station_times))]
+        estimates = []
+        for order in self.__order_server.values():
+            free_at, index = stations[0]
+            completion_time = free_at + len(order.items) * station_times[index]
+            heapq.heapreplace(stations, (completion_time, index))
+            estimates.append({'order_num': order.order_num, 'station': index, 'completion_time': completion_time})
+        return estimates
+
+
+class AsyncOrderServer:
+    """
+    Class making practice: asyncio front-end for DatabaseServerManager.
+    Producers await make_order, which waits while the queue is full (backpressure).
+    Workers await serve_next, which waits for an order instead of busy-polling serveNextOrder.
+    While the server is running, the wrapped manager's queue should only be changed through this object.
+    """
+
+    def __init__(self, manager=None, max_queued=1000):
+        """
+        Initializes the server around a DatabaseServerManager.
+
+        Parameters:
+        - manager (DatabaseServerManager, optional): The manager to serve. Defaults to a new, empty manager.
+        - max_queued (int, optional): Queue length at which make_order starts waiting. Defaults to 1000.
+
+        Attributes:
+        - __manager: The wrapped DatabaseServerManager.
+        - __not_empty / __not_full: Private conditions sharing one lock, used to wake consumers and producers.
+        - __closed: A private flag set by close(); waiting calls then return instead of blocking.
+        """
+        self.__manager = manager if manager is not None else DatabaseServerManager()
+        self.__max_queued = max_queued
+        lock = asyncio.Lock()
+        self.__not_empty = asyncio.Condition(lock)
+        self.__not_full = asyncio.Condition(lock)
+        self.__closed = False
+
+    def getManager(self):
+        """
+        Returns:
+        - DatabaseServerManager: The wrapped manager.
+        """
+        return self.__manager
+
+    async def make_order(self, order_num, order_list, customer_id=None):
+        """
+        Places a new order, waiting while the queue holds max_queued orders.
+
+        Parameters:
+        - order_num (str): Unique order identifier.
+        - order_list (list): List of items in the order.
+        - customer_id (str, optional): Registered customer placing the order. Defaults to None.
+
+        Returns:
+        - list: [order_num, order_list] if the order is successfully added.
+        - int: -1 if the order number already exists or the server is closed.
+        - int: -2 if customer_id is given but not registered.
+        """
+        async with self.__not_full:
+            await self.__not_full.wait_for(lambda: self.__closed or self.__manager.getOrderCount() < self.__max_queued)
+            if self.__closed:
+                return -1
+            new_order = self.__manager.makeOrder(order_num, order_list, customer_id)
+            if not isinstance(new_order, int):
+                self.__not_empty.notify()
+            return new_order
+
+    async def cancel_order(self, order_num):
+        """
+        Cancels a queued order and lets one waiting producer continue.
+
+        Parameters:
+        - order_num (str): Unique order identifier.
+
+        Returns:
+        - list: [order_num, order_items] if the order is successfully removed.
+        - int: -1 if the order is not found.
+        """
+        async with self.__not_full:
+            order = self.__manager.cancelOrder(order_num)
+            if order != -1:
+                self.__not_full.notify()
+            return order
+
+    async def serve_next(self):
+        """
+        Serves the next order, waiting until one is queued.
+
+        Returns:
+        - list: [order_num, order_items] for the served order.
+        - int: -1 if the server was closed and the queue is empty.
+        """
+        async with self.__not_empty:
+            await self.__not_empty.wait_for(lambda: self.__closed or self.__manager.getOrderCount() > 0)
+            order = self.__manager.serveNextOrder()
+            if order != -1:
+                self.__not_full.notify()
+            return order
+
+    def __aiter__(self):
+        """
+        Iterates over served orders until the server is closed and drained.
+        """
+        return self
+
+    async def __anext__(self):
+        order = await self.serve_next()
+        if order == -1:
+            raise StopAsyncIteration
+        return order
+
+    async def serve_forever(self, handler, workers=4):
+        """
+        Runs worker coroutines that serve orders and pass each one to handler, until the server is closed and drained.
+
+        Parameters:
+        - handler (callable): Called with each served [order_num, order_items]; may be a coroutine function.
+        - workers (int, optional): Number of concurrent worker coroutines. Defaults to 4.
+
+        Returns:
+        - int: The total number of orders served.
+        """
+        async def worker():
+            served = 0
+            async for order in self:
+                result = handler(order)
+                if inspect.isawaitable(result):
+                    await result
+                served += 1
+            return served
+
+        return sum(await asyncio.gather(*(worker() for _ in range(workers))))
+
+    async def close(self):
+        """
+        Stops accepting orders. Workers finish the remaining queue and then stop.
+        """
+        async with self.__not_empty:
+            self.__closed = True
+            self.__not_empty.notify_all()
+            self.__not_full.notify_all()
+
+
+def _shardWorker(connection):
+    """
+    Process entry point for one shard of ShardedDatabaseServerManager.
+    Holds two managers: one for the customers and orders hashed to this shard by id,
+    and one name index for the customers whose names hash to this shard.
+    Serves (target, method, args) requests from the pipe until it receives None, answering each with
+    (True, result), or (False, exception) if the method raised, so one bad request does not stop the shard.
+
+    Parameters:
+    - connection (multiprocessing.connection.Connection): The shard's end of the pipe.
+    """
+    managers = (DatabaseServerManager(), DatabaseServerManager())
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        target, method, args = request
+        try:
+            connection.send((True, getattr(managers[target], method)(*args)))
+        except Exception as error:
+            try:
+                connection.send((False, error))
+            except Exception:  # the exception itself cannot be pickled
+                connection.send((False, RuntimeError(repr(error))))
+    connection.close()
+
+
+class ShardedDatabaseServerManager:
+    """
+    Class making practice: DatabaseServerManager partitioned across worker processes.
+    Customers are hash-partitioned by customer ID; orders go to their customer's shard, or are hashed by
+    order number when they have no customer. Each shard is a process
+    holding its own DatabaseServerManager and talking to the coordinator over a local pipe.
+    A second, name-partitioned index on the shards lets getDuplicateCustomerNames find duplicates across shards.
+    The coordinator keeps only the global FIFO order of order numbers, so serveNextOrder stays first-in, first-out.
+    An instance must be used from one thread at a time.
+    """
+
+    CUSTOMERS = 0
+    NAMES = 1
+
+    def __init__(self, shards=None):
+        """
+        Starts the shard processes.
+
+        Parameters:
+        - shards (int, optional): Number of shard processes. Defaults to the number of CPU cores.
+
+        Attributes:
+        - __connections: Private list of coordinator-side pipe ends, one per shard.
+        - __processes: Private list of shard processes.
+        - __order_shards: A private ordered dictionary of queued order numbers in FIFO order (order number -> shard).
+        """
+        shards = shards or os.cpu_count() or 1
+        self.__connections = []
+        self.__processes = []
+        for _ in range(shards):
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_shardWorker, args=(child_connection,), daemon=True)
+            process.start()
+            child_connection.close()
+            self.__connections.append(parent_connection)
+            self.__processes.append(process)
+        self.__order_shards = OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Stops all shard processes. Their data is discarded.
+        """
+        for connection in self.__connections:
+            connection.send(None)
+            connection.close()
+        for process in self.__processes:
+            process.join()
+        self.__connections = []
+        self.__processes = []
+
+    def __shardOf(self, key):
+        """
+        Returns:
+        - int: The shard index a customer ID, customer name or order number hashes to.
+        """
+        return zlib.crc32(str(key).encode("utf-8")) % len(self.__connections)
+
+    def __call(self, shard, target, method, *args):
+        """
+        Runs one manager method on one shard and waits for its result. An exception raised on the shard is re-raised here.
+        """
+        connection = self.__connections[shard]
+        connection.send((target, method, args))
+        succeeded, result = connection.recv()
+        if not succeeded:
+            raise result
+        return result
+
+    def __scatter(self, target, requests):
+        """
+        Sends one request to each listed shard, then gathers all results, so the shards work in parallel.
+
+        Parameters:
+        - target (int): CUSTOMERS or NAMES.
+        - requests (dict): {shard: (method, args)}.
+
+        Returns:
+        - dict: {shard: result}. If a shard raised, its exception is re-raised once every shard has answered.
+        """
+        replies = self.__gather(target, requests)
+        for succeeded, result in replies.values():
+            if not succeeded:
+                raise result
+        return {shard: result for shard, (succeeded, result) in replies.items()}
+
+    def __gather(self, target, requests):
+        """
+        Sends one request to each listed shard and collects every reply, failed or not, keeping the pipes in step.
+
+        Returns:
+        - dict: {shard: (succeeded, result or exception)}.
+        """
+        for shard, (method, args) in requests.items():
+            self.__connections[shard].send((target, method, args))
+        return {shard: self.__connections[shard].recv() for shard in requests}
+
+    def __scatterAll(self, target, method, *args):
+        """
+        Runs the same method on every shard.
+
+        Returns:
+        - list: One result per shard.
+        """
+        requests = {shard: (method, args) for shard in range(len(self.__connections))}
+        return list(self.__scatter(target, requests).values())
+
+    def registerCustomer(self, customer_id, customer_name):
+        """
+        Registers a new customer on its shard. Same return values as DatabaseServerManager.registerCustomer.
+        """
+        result = self.__call(self.__shardOf(customer_id), self.CUSTOMERS, "registerCustomer", customer_id, customer_name)
+        if result != -1:
+            self.__call(self.__shardOf(customer_name), self.NAMES, "registerCustomer", customer_id, customer_name)
+        return result
+
+    def registerCustomers(self, customers):
+        """
+        Registers many customers, sending one batch to each shard in parallel.
+
+        Parameters:
+        - customers (iterable): (customer_id, customer_name) pairs.
+
+        Returns:
+        - list: Customer IDs rejected because they already exist.
+        """
+        rejected = []
+        batch = {}
+        for customer_id, customer_name in customers:
+            if customer_id in batch:
+                rejected.append(customer_id)
+            else:
+                batch[customer_id] = customer_name
+
+        by_shard = {}
+        for customer_id, customer_name in batch.items():
+            by_shard.setdefault(self.__shardOf(customer_id), []).append((customer_id, customer_name))
+        results = self.__scatter(self.CUSTOMERS, {shard: ("registerCustomers", (pairs,)) for shard, pairs in by_shard.items()})
+
+        existing = set()
+        for shard_rejected in results.values():
+            existing.update(shard_rejected)
+            rejected.extend(shard_rejected)
+        by_name_shard = {}
+        for customer_id, customer_name in batch.items():
+            if customer_id not in existing:
+                by_name_shard.setdefault(self.__shardOf(customer_name), []).append((customer_id, customer_name))
+        self.__scatter(self.NAMES, {shard: ("registerCustomers", (pairs,)) for shard, pairs in by_name_shard.items()})
+        return rejected
+
+    def getCustomerByID(self, customer_id):
+        """
+        Same return values as DatabaseServerManager.getCustomerByID.
+        """
+        return self.__call(self.__shardOf(customer_id), self.CUSTOMERS, "getCustomerByID", customer_id)
+
+    def getCustomersByName(self, customer_name):
+        """
+        Same return values as DatabaseServerManager.getCustomersByName; answered by the name's shard alone.
+        """
+        return self.__call(self.__shardOf(customer_name), self.NAMES, "getCustomersByName", customer_name)
+
+    def updateCustomerName(self, customer_id, new_name):
+        """
+        Same return values as DatabaseServerManager.updateCustomerName.
+        """
+        shard = self.__shardOf(customer_id)
+        old_customer = self.__call(shard, self.CUSTOMERS, "getCustomerByID", customer_id)
+        if old_customer == -1:
+            return -1
+        self.__call(self.__shardOf(old_customer[customer_id]), self.NAMES, "removeCustomer", customer_id)
+        self.__call(self.__shardOf(new_name), self.NAMES, "registerCustomer", customer_id, new_name)
+        return self.__call(shard, self.CUSTOMERS, "updateCustomerName", customer_id, new_name)
+
+    def removeCustomer(self, customer_id, cascade=False):
+        """
+        Same parameters and return values as DatabaseServerManager.removeCustomer.
+        """
+        shard = self.__shardOf(customer_id)
+        if cascade:
+            customer_orders = self.__call(shard, self.CUSTOMERS, "getOrdersByCustomer", customer_id)
+            for order in (customer_orders if customer_orders != -1 else ()):
+                del self.__order_shards[order[0]]
+        removed_customer = self.__call(shard, self.CUSTOMERS, "removeCustomer", customer_id, cascade)
+        if removed_customer != -1:
+            self.__call(self.__shardOf(removed_customer[customer_id]), self.NAMES, "removeCustomer", customer_id)
+        return removed_customer
+
+    def __orderShardOf(self, order_num, customer_id):
+        """
+        Returns:
+        - int: The shard of the order's customer, or the shard its order number hashes to if it has no customer.
+        """
+        return self.__shardOf(order_num if customer_id is None else customer_id)
+
+    def __holdsOrder(self, shard, order_num):
+        """
+        Returns:
+        - bool: True if the shard has the order queued. Asks for its waiting time, which is sent back as a plain int.
+        """
+        return self.__call(shard, self.CUSTOMERS, "getWaitingTime", order_num, 0) != -1
+
+    def makeOrder(self, order_num, order_list, customer_id=None):
+        """
+        Places a new order on its shard. Same parameters and return values as DatabaseServerManager.makeOrder.
+        """
+        if order_num in self.__order_shards:
+            return -1
+        shard = self.__orderShardOf(order_num, customer_id)
+        try:
+            new_order = self.__call(shard, self.CUSTOMERS, "makeOrder", order_num, order_list, customer_id)
+        except Exception:
+            # e.g. the reply could not be pickled after the order was queued
+            if self.__holdsOrder(shard, order_num):
+                self.__order_shards[order_num] = shard
+            raise
+        if new_order != -2:
+            self.__order_shards[order_num] = shard
+        return new_order
+
+    def makeOrders(self, orders):
+        """
+        Places many orders, sending one batch to each shard in parallel.
+
+        Parameters:
+        - orders (iterable): (order_num, order_list) pairs or (order_num, order_list, customer_id) triples.
+
+        Returns:
+        - list: Order numbers rejected because they already exist or name an unregistered customer.
+        """
+        rejected = []
+        by_shard = {}
+        shard_of = {}  # order number -> shard, in input order; recorded once the shards have answered
+        for record in orders:
+            order_num = record[0]
+            if order_num in self.__order_shards or order_num in shard_of:
+                rejected.append(order_num)
+                continue
+            shard = self.__orderShardOf(order_num, record[2] if len(record) > 2 else None)
+            shard_of[order_num] = shard
+            by_shard.setdefault(shard, []).append(record)
+        replies = self.__gather(self.CUSTOMERS, {shard: ("makeOrders", (batch,)) for shard, batch in by_shard.items()})
+
+        error = None
+        for shard, (succeeded, result) in replies.items():
+            if succeeded:
+                shard_rejected = result
+            else:
+                # the shard queued the records before the failing one; ask it which orders it holds
+                error = error or result
+                shard_rejected = [order_num for order_num, shard_of_order in shard_of.items()
+                                  if shard_of_order == shard and not self.__holdsOrder(shard, order_num)]
+            for order_num in shard_rejected:
+                del shard_of[order_num]
+            if succeeded:
+                rejected.extend(shard_rejected)
+        self.__order_shards.update(shard_of)
+        if error is not None:
+            raise error
+        return rejected
+
+    def cancelOrder(self, order_num):
+        """
+        Same return values as DatabaseServerManager.cancelOrder.
+        """
+        shard = self.__order_shards.pop(order_num, None)
+        if shard is None:
+            return -1
+        return self.__call(shard, self.CUSTOMERS, "cancelOrder", order_num)
+
+    def serveNextOrder(self):
+        """
+        Serves the oldest order across all shards. Same return values as DatabaseServerManager.serveNextOrder.
+        """
+        if not self.__order_shards:
+            return -1
+        shard = self.__order_shards.popitem(last=False)[1]
+        return self.__call(shard, self.CUSTOMERS, "serveNextOrder")
+
+    def addServiceToOrder(self, order_num, service):
+        """
+        Same return values as DatabaseServerManager.addServiceToOrder.
+        """
+        shard = self.__order_shards.get(order_num)
+        if shard is None:
+            return -1
+        return self.__call(shard, self.CUSTOMERS, "addServiceToOrder", order_num, service)
+
+    def getOrderDetails(self, order_num):
+        """
+        Same return values as DatabaseServerManager.getOrderDetails.
+        """
+        shard = self.__order_shards.get(order_num)
+        if shard is None:
+            return -1
+        return self.__call(shard, self.CUSTOMERS, "getOrderDetails", order_num)
+
+    def getOrdersByCustomer(self, customer_id):
+        """
+        Same return values as DatabaseServerManager.getOrdersByCustomer; answered by the customer's shard alone.
+        """
+        return self.__call(self.__shardOf(customer_id), self.CUSTOMERS, "getOrdersByCustomer", customer_id)
+
+    def getCustomerItemTotal(self, customer_id):
+        """
+        Same return values as DatabaseServerManager.getCustomerItemTotal; answered by the customer's shard alone.
+        """
+        return self.__call(self.__shardOf(customer_id), self.CUSTOMERS, "getCustomerItemTotal", customer_id)
+
+    def getOrderCount(self):
+        """
+        Returns:
+        - int: The count of active orders on all shards.
+        """
+        return sum(self.__scatterAll(self.CUSTOMERS, "getOrderCount"))
+
+    def calculateTotalItems(self):
+        """
+        Returns:
+        - int: The total count of items in all orders on all shards.
+        """
+        return sum(self.__scatterAll(self.CUSTOMERS, "calculateTotalItems"))
+
+    def getCustomerList(self):
+        """
+        Returns:
+        - dict: All customers from all shards in the format {customer_id: customer_name}.
+        """
+        customers = {}
+        for shard_customers in self.__scatterAll(self.CUSTOMERS, "getCustomerList"):
+            customers.update(shard_customers)
+        return customers
+
+    def getDuplicateCustomerNames(self):
+        """
+        Returns:
+        - dict: {customer_id: customer_name} for customers with duplicate names on any shards.
+        """
+        duplicates = {}
+        for shard_duplicates in self.__scatterAll(self.NAMES, "getDuplicateCustomerNames"):
+            duplicates.update(shard_duplicates)
+        return duplicates
+
+    def getCustomerOrders(self):
+        """
+        Returns:
+        - list: All active orders from all shards, in global queue order.
+        """
+        orders = {}
+        for shard_orders in self.__scatterAll(self.CUSTOMERS, "getCustomerOrders"):
+            for order in shard_orders:
+                orders[order[0]] = order
+        return [orders[order_num] for order_num in self.__order_shards]
@@ -1,3 +1,114 @@
+# import Counter to count words in C, and multiprocessing and os modules to count large files in parallel
+import multiprocessing
+import os
+from collections import Counter
+
+_WHITESPACE = b' \t\n\r\x0b\x0c'  # ASCII whitespace; never part of a multi-byte UTF-8 character
+
+
+def _merge_counts(result_dict, counts):
+    """
+    Adds word counts into result_dict in place, the same way EnhancedPersonalVocaManager.__add__ merges dictionaries.
+
+    Parameters:
+    - result_dict (dict): The word frequencies to add to.
+    - counts (dict): The word frequencies to add.
+    """
+    for item in counts:
+        result_dict[item] = result_dict.get(item, 0) + counts[item]
+
+
+def _merge_dictionaries(dictionaries):
+    """
+    Merges word frequency dictionaries in one pass over their entries.
+    The largest one is copied whole (a C-level copy) and the others are added to the copy.
+
+    Parameters:
+    - dictionaries (list): The word frequency dictionaries to merge; they are not changed.
+
+    Returns:
+    - dict: The merged word frequencies.
+    """
+    if not dictionaries:
+        return {}
+    largest = max(range(len(dictionaries)), key=lambda index: len(dictionaries[index]))
+    result_dict = dictionaries[largest].copy()
+    for index, counts in enumerate(dictionaries):
+        if index != largest:
+            _merge_counts(result_dict, counts)
+    return result_dict
+
+
+def _file_ranges(filename, chunk_size):
+    """
+    Splits a text file into byte ranges of about chunk_size bytes, so no word is cut in half.
+    A range ends after the last newline in the 64 KiB before its cut point, or after other whitespace
+    when there is none, so files with very long lines (or a single line) still split into bounded chunks.
+
+    Yields:
+    - tuple: (filename, start, end).
+    """
+    size = os.path.getsize(filename)
+    window = min(chunk_size, 1 << 16)
+    with open(filename, 'rb') as file:
+        start = 0
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                end = size
+            else:
+                file.seek(end - window)
+                tail = file.read(window)
+                cut = tail.rfind(b'\n') + 1 or max(tail.rfind(byte) for byte in _WHITESPACE) + 1
+                if cut:
+                    end += cut - window
+                else:
+                    end = _skip_word(file, end, size, window)
+            yield filename, start, end
+            start = end
+
+
+def _skip_word(file, position, size, window):
+    """
+    Returns:
+    - int: The offset just after the first whitespace byte at or after position, or size if there is none.
+    """
+    file.seek(position)
+    while position < size:
+        block = file.read(window)
+        hits = [index for index in (block.find(byte) for byte in _WHITESPACE) if index != -1]
+        if hits:
+            return position + min(hits) + 1
+        position += len(block)
+    return size
+
+
+def _read_file_range(file_range):
+    """
+    Reads the whole words stored in one byte range of a text file.
+
+    Parameters:
+    - file_range (tuple): (filename, start, end) byte offsets aligned to whitespace.
+
+    Returns:
+    - str: The decoded text of the range.
+    """
+    filename, start, end = file_range
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        return file.read(end - start).decode('utf-8')
+
+
+def _count_file_range(file_range):
+    """
+    Worker entry point: counts the whitespace-separated words in one byte range of a text file.
+
+    Returns:
+    - Counter: The word frequencies of the range.
+    """
+    return Counter(_read_file_range(file_range).split())
+
+
 class PersonalVocaManager:
     """
     Class making practice: Simple personal vocabulary trainer which stores words and their frequencies.
@@ -55,16 +166,42 @@ class PersonalVocaManager:
     def store_wordlist_as_dictionary(self, word_list):
         """
         Converts a list of words into a dictionary with word frequencies.
+        The words are counted in one streaming pass, so any iterable or generator works and the list is left unchanged.
 
         Parameters:
-        - word_list (list): A list of words to store in the dictionary.
+        - word_list (iterable): The words to store in the dictionary.
 
         Returns:
         - dict: A dictionary with word frequencies.
         """
-        word_list.sort()
-        for word in word_list:
-            self.__dict[word] = self.__dict.get(word, 0) + 1
+        _merge_counts(self.__dict, Counter(word_list))
+        return self.__dict
+
+    def store_words_from_file(self, filename, processes=1, chunk_size=1 << 24):
+        """
+        Stores the whitespace-separated words of a text file in the dictionary.
+        The file is read in chunks of whole words, so memory stays bounded by the chunk size plus the vocabulary,
+        even for a file that is one long line.
+        With several processes the chunks are counted in a process pool and the partial counts are merged here.
+
+        Parameters:
+        - filename (str): The UTF-8 text file to read.
+        - processes (int, optional): Number of worker processes. Defaults to 1 (count in this process).
+        - chunk_size (int, optional): Approximate chunk size in bytes. Defaults to 16 MiB.
+
+        Returns:
+        - dict: A dictionary with word frequencies.
+        """
+        ranges = _file_ranges(filename, chunk_size)
+        if processes > 1:
+            with multiprocessing.Pool(processes) as pool:
+                for counts in pool.imap_unordered(_count_file_range, ranges):
+                    _merge_counts(self.__dict, counts)
+        else:
+            counts = Counter()
+            for file_range in ranges:
+                counts.update(_read_file_range(file_range).split())
+            _merge_counts(self.__dict, counts)
         return self.__dict
 
     def get_word_count(self, keyword):
@@ -143,9 +280,47 @@ class EnhancedPersonalVocaManager(PersonalVocaManager):
         - EnhancedPersonalVocaManager: A new object with the merged dictionary.
         """
         result_dict = self._PersonalVocaManager__dict.copy()
-        for item in target._PersonalVocaManager__dict:
-            result_dict[item] = result_dict.get(item, 0) + target._PersonalVocaManager__dict[item]
+        _merge_counts(result_dict, target._PersonalVocaManager__dict)
 
         result_object = EnhancedPersonalVocaManager("0000")
         result_object._PersonalVocaManager__dict = result_dict
         return result_object
+
+    def __iadd__(self, target):
+        """
+        Merges another EnhancedPersonalVocaManager's dictionary into this one in place, without copying either.
+
+        Parameters:
+        - target (EnhancedPersonalVocaManager): The object to merge in.
+
+        Returns:
+        - EnhancedPersonalVocaManager: This object.
+        """
+        _merge_counts(self._PersonalVocaManager__dict, target._PersonalVocaManager__dict)
+        return self
+
+    @staticmethod
+    def merge_many(managers, processes=1):
+        """
+        Merges the dictionaries of many EnhancedPersonalVocaManager objects into a new object in time linear
+        in the total number of entries, unlike chaining + which copies the growing result at every step.
+        With several processes the managers are split into groups that are merged in a process pool,
+        then the group results are merged here. That only pays off for very large vocabularies,
+        since every dictionary has to be sent to a worker.
+
+        Parameters:
+        - managers (iterable): The EnhancedPersonalVocaManager objects to merge; they are not changed.
+        - processes (int, optional): Number of worker processes. Defaults to 1 (merge in this process).
+
+        Returns:
+        - EnhancedPersonalVocaManager: A new object with the merged dictionary.
+        """
+        dictionaries = [manager._PersonalVocaManager__dict for manager in managers]
+        if processes > 1 and len(dictionaries) > processes:
+            groups = [dictionaries[index::processes] for index in range(processes)]
+            with multiprocessing.Pool(processes) as pool:
+                dictionaries = pool.map(_merge_dictionaries, groups)
+
+        result_object = EnhancedPersonalVocaManager("0000")
+        result_object._PersonalVocaManager__dict = _merge_dictionaries(dictionaries)
+        return result_object
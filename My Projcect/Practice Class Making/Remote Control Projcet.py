@@ -1,3 +1,47 @@
+# import bisect module to keep the lineup and the favor buckets sorted
+# import multiprocessing and islice to replay recorded sessions in parallel chunks
+# import random and time modules for the replay benchmark
+# import struct module for the binary lineup format, and os module to accept path-like file names
+import bisect
+import multiprocessing
+import os
+import random
+import struct
+import time
+from itertools import islice
+
+_LINEUP_MAGIC = b'RCL1'
+_LINEUP_HEADER = struct.Struct('<4sI')  # magic, channel count
+_LINEUP_RECORD = struct.Struct('<iI')  # channel number, favor count
+_LINEUP_TEXT_HEADER = 'number,favor,name'  # first line of the text format; without it lines are "number,name"
+
+
+class _ChannelNode:
+    """
+    One enabled channel in the lineup ring.
+
+    Attributes:
+    - number / name: The channel number (int) and channel name (str).
+    - favor: How many times the channel was marked as a favorite (0 if never).
+    - prev / next: The neighbouring nodes; the ring wraps from the highest number back to the lowest.
+    """
+    __slots__ = ('number', 'name', 'favor', 'prev', 'next')
+
+    def __init__(self, number, name, favor=0):
+        self.number = number
+        self.name = name
+        self.favor = favor
+        self.prev = self
+        self.next = self
+
+    def toList(self):
+        """
+        Returns:
+        - list: [channel number, channel name], followed by the favor count once the channel was favored.
+        """
+        return [self.number, self.name, self.favor] if self.favor else [self.number, self.name]
+
+
 class RemoteControl:
     """
     Class making practice: Implements basic functionalities of a remote control.
@@ -5,28 +49,92 @@ class RemoteControl:
     """
     def __init__(self):
         """
-        Initializes the RemoteControl class with an empty list for enabled channels.
+        Initializes the RemoteControl class with an empty channel lineup.
         Attributes:
-        - __enabledChannelList: A private list storing [channel number (int), channel name (str)].
-        - __current_channel: A private attribute pointing to the currently active channel.
+        - __nodes: A private dictionary of enabled channels (channel number -> _ChannelNode).
+        - __numbers: A private sorted list of the enabled channel numbers, to place unblocked channels.
+        - __head: The node with the lowest channel number; the nodes form a ring sorted by channel number.
+        - __current: A private attribute pointing to the node of the currently active channel.
+        - __favor_buckets: A private dictionary of favored channels (favor count -> sorted channel numbers).
+        - __favors: A private sorted list of the favor counts that have a bucket, so the lowest and highest are at the ends.
         """
-        self.__enabledChannelList = []
-        self.__current_channel = None
+        self.__nodes = {}
+        self.__numbers = []
+        self.__head = None
+        self.__current = None
+        self.__favor_buckets = {}
+        self.__favors = []
 
     def powerOnRemoteControl(self, channel_list):
         """
         Activates the remote control with a given list of channels.
+        The lineup is kept sorted by channel number and the lowest number becomes the current channel.
+        A channel number that is already enabled keeps its first entry. Names are stored stripped of surrounding spaces.
 
         Parameters:
-        - channel_list (list): A list of lists, where each inner list contains [channel number (int), channel name (str)].
+        - channel_list (list): A list of lists, where each inner list contains [channel number (int), channel name (str)]
+          and optionally a favor count as a third element.
 
         Returns:
-        - int: The number of channels added to the enabled list.
+        - int: The number of channels in the enabled lineup.
         """
         for channel in channel_list:
-            self.__enabledChannelList.append(channel)
-        self.__current_channel = self.__enabledChannelList[0] if self.__enabledChannelList else None
-        return len(self.__enabledChannelList)
+            if channel[0] not in self.__nodes:
+                self.__nodes[channel[0]] = _ChannelNode(channel[0], channel[1].strip(), channel[2] if len(channel) > 2 else 0)
+        self.__numbers = sorted(self.__nodes)
+        self.__relink()
+        self.__current = self.__head
+        return len(self.__numbers)
+
+    def __relink(self):
+        """
+        Rebuilds the ring links and the favor buckets in one pass over the sorted channel numbers.
+        """
+        self.__favor_buckets = {}
+        if not self.__numbers:
+            self.__head = None
+            self.__favors = []
+            return
+        nodes = [self.__nodes[number] for number in self.__numbers]
+        previous = nodes[-1]
+        for node in nodes:
+            node.prev = previous
+            previous.next = node
+            previous = node
+            if node.favor:
+                self.__favor_buckets.setdefault(node.favor, []).append(node.number)
+        self.__head = nodes[0]
+        self.__favors = sorted(self.__favor_buckets)
+
+    def __iterNodes(self):
+        """
+        Yields the enabled channel nodes in lineup order, starting from the lowest number.
+        """
+        node = self.__head
+        for _ in range(len(self.__numbers)):
+            yield node
+            node = node.next
+
+    def __addFavor(self, node):
+        """
+        Puts a favored channel into the bucket of its favor count.
+        """
+        bucket = self.__favor_buckets.get(node.favor)
+        if bucket is None:
+            self.__favor_buckets[node.favor] = [node.number]
+            bisect.insort(self.__favors, node.favor)
+        else:
+            bisect.insort(bucket, node.number)
+
+    def __removeFavor(self, node):
+        """
+        Takes a favored channel out of the bucket of its favor count, dropping the bucket once it is empty.
+        """
+        bucket = self.__favor_buckets[node.favor]
+        del bucket[bisect.bisect_left(bucket, node.number)]
+        if not bucket:
+            del self.__favor_buckets[node.favor]
+            del self.__favors[bisect.bisect_left(self.__favors, node.favor)]
 
     def gotoChannel(self, channel_num):
         """
@@ -38,14 +146,13 @@ class RemoteControl:
         Returns:
         - str: The name of the channel switched to, or the current channel name if not found.
         """
-        if not self.__enabledChannelList:
+        if not self.__nodes:
             return "No channels available"
 
-        for channel in self.__enabledChannelList:
-            if channel[0] == channel_num:
-                self.__current_channel = channel
-                return channel[1]
-        return self.__current_channel[1]
+        node = self.__nodes.get(channel_num)
+        if node is not None:
+            self.__current = node
+        return self.__current.name
 
     def nextChannel(self):
         """
@@ -54,13 +161,11 @@ class RemoteControl:
         Returns:
         - str: The name of the channel switched to.
         """
-        if not self.__enabledChannelList:
+        if not self.__nodes:
             return "No channels available"
 
-        current_channel_index = self.__enabledChannelList.index(self.__current_channel)
-        next_channel_index = (current_channel_index + 1) % len(self.__enabledChannelList)
-        self.__current_channel = self.__enabledChannelList[next_channel_index]
-        return self.__current_channel[1]
+        self.__current = self.__current.next
+        return self.__current.name
 
     def previousChannel(self):
         """
@@ -69,32 +174,30 @@ class RemoteControl:
         Returns:
         - str: The name of the channel switched to.
         """
-        if not self.__enabledChannelList:
+        if not self.__nodes:
             return "No channels available"
 
-        current_channel_index = self.__enabledChannelList.index(self.__current_channel)
-        prev_channel_index = (current_channel_index - 1) % len(self.__enabledChannelList)
-        self.__current_channel = self.__enabledChannelList[prev_channel_index]
-        return self.__current_channel[1]
+        self.__current = self.__current.prev
+        return self.__current.name
 
     def blockChannel(self):
         """
-        Blocks the current channel, removing it from the enabled list.
+        Blocks the current channel, removing it from the enabled lineup. The lowest channel becomes current.
 
         Returns:
-        - str: The name of the newly selected current channel, or a message if no channels remain.
+        - list: The newly selected current channel, or a message if no channels remain.
         """
-        if not self.__enabledChannelList:
+        if not self.__nodes:
             return "No channels to block"
 
-        blocked_channel = self.__current_channel
-        self.__enabledChannelList.remove(blocked_channel)
-        self.__current_channel = self.__enabledChannelList[0] if self.__enabledChannelList else None
-        return self.__current_channel if self.__current_channel else "No channels available"
+        self.__unlink(self.__current)
+        self.__current = self.__head
+        return self.__current.toList() if self.__current else "No channels available"
 
     def unblockChannel(self, blocked_channel_num):
         """
-        Re-enables a previously blocked channel.
+        Re-enables a previously blocked channel at its place in the sorted lineup, with an empty name.
+        The lowest channel becomes current.
 
         Parameters:
         - blocked_channel_num (int): The number of the blocked channel to be re-added.
@@ -102,34 +205,198 @@ class RemoteControl:
         Returns:
         - int: 1 if successfully unblocked, -1 if the channel is already enabled.
         """
-        if not any(blocked_channel_num == channel[0] for channel in self.__enabledChannelList):
-            insert_index = 0
-            for i, channel in enumerate(self.__enabledChannelList):
-                if channel[0] > blocked_channel_num:
-                    insert_index = i
-                    break
-            self.__enabledChannelList.insert(insert_index, [blocked_channel_num, ""])
-            self.__current_channel = self.__enabledChannelList[0]
-            return 1
-        else:
+        if blocked_channel_num in self.__nodes:
             return -1
 
-    def powerOffRemoteControl(self):
+        self.__link(_ChannelNode(blocked_channel_num, ""))
+        self.__current = self.__head
+        return 1
+
+    def __link(self, node):
+        """
+        Adds a channel node to the lineup at its sorted place, in O(log n) plus a short list insert.
+        """
+        index = bisect.bisect_left(self.__numbers, node.number)
+        if self.__head is not None:
+            # the ring wraps, so a new highest number goes just before the head
+            following = self.__nodes[self.__numbers[index]] if index < len(self.__numbers) else self.__head
+            node.prev = following.prev
+            node.next = following
+            following.prev.next = node
+            following.prev = node
+        if index == 0:
+            self.__head = node
+        self.__nodes[node.number] = node
+        self.__numbers.insert(index, node.number)
+        if node.favor:
+            self.__addFavor(node)
+
+    def __unlink(self, node):
+        """
+        Removes a channel node from the lineup, its favor bucket and the ring.
+        """
+        del self.__nodes[node.number]
+        del self.__numbers[bisect.bisect_left(self.__numbers, node.number)]
+        if node.favor:
+            self.__removeFavor(node)
+        if not self.__nodes:
+            self.__head = None
+            return
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        if node is self.__head:
+            self.__head = node.next
+
+    def powerOffRemoteControl(self, filename='output.csv'):
         """
         Saves the list of enabled channels to a CSV file.
 
         File format:
-        - Each line contains a channel number and name separated by a comma.
+        - Each line contains a channel number and name separated by a comma. Favor counts are not saved;
+          use saveLineup to keep them.
+
+        Parameters:
+        - filename (str, optional): The file to save to. Defaults to 'output.csv'.
 
         Returns:
         - str: A message indicating success or if there are no channels to save.
         """
-        if not self.__enabledChannelList:
+        if not self.__nodes:
             return "No channels to save"
 
-        with open('output.csv', 'w') as file:
-            for channel in self.__enabledChannelList:
-                file.write(f'{channel[0]},{channel[1].strip()}\n')
+        with open(filename, 'w', encoding='utf-8', newline='\n', buffering=1 << 20) as file:
+            file.writelines(f'{node.number},{node.name.strip()}\n' for node in self.__iterNodes())
+
+    def loadLineup(self, source, chunk_size=1 << 20):
+        """
+        Replaces the lineup with the channels stored in a lineup file and makes the lowest channel current.
+        The file is read in large chunks and the lineup, ring and favor buckets are built in one pass at the end.
+        Both formats written by saveLineup are accepted; the binary one is recognized by its magic bytes.
+        Text files without the saveLineup header line are read as "number,name" lines, as written by powerOffRemoteControl.
+        Text lines that do not start with a channel number are skipped. A repeated channel number keeps its first entry.
+
+        Parameters:
+        - source (str, os.PathLike or file object): A path, or a file object opened in text or binary mode.
+        - chunk_size (int, optional): Number of characters or bytes read at a time. Defaults to 1 MiB.
+
+        Returns:
+        - int: The number of channels in the loaded lineup.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as file:
+                return self.loadLineup(file, chunk_size)
+
+        first = source.read(len(_LINEUP_MAGIC))
+        if first == _LINEUP_MAGIC:
+            nodes = self.__readBinaryLineup(first, source)
+        else:
+            nodes = self.__readTextLineup(first, source, chunk_size)
+        self.__nodes = nodes
+        self.__numbers = sorted(nodes)
+        self.__relink()
+        self.__current = self.__head
+        return len(self.__numbers)
+
+    def __readTextLineup(self, data, source, chunk_size):
+        """
+        Parses "number,favor,name" lines (after the header line) or "number,name" lines chunk by chunk.
+
+        Returns:
+        - dict: The channel nodes by channel number.
+        """
+        nodes = {}
+        newline = b'\n' if isinstance(data, bytes) else '\n'
+        pending = data[:0]
+        favored = None  # decided by the first line
+        while data:
+            # only whole lines are parsed (and decoded), so a line or character split across chunks waits for the next read
+            data = pending + data
+            end = data.rfind(newline) + 1
+            complete, pending = data[:end], data[end:]
+            text = complete.decode('utf-8') if newline == b'\n' else complete
+            if favored is None and text:
+                favored = text.split('\n', 1)[0].strip() == _LINEUP_TEXT_HEADER
+            self.__parseLineupLines(text, nodes, favored)
+            data = source.read(chunk_size)
+        self.__parseLineupLines(pending.decode('utf-8') if newline == b'\n' else pending, nodes, favored)
+        return nodes
+
+    def __parseLineupLines(self, text, nodes, favored):
+        """
+        Adds the channels on the complete text lines in text to nodes.
+        With favored set, the favor count comes before the name, so names may contain any character but a newline.
+        """
+        for line in text.split('\n'):
+            number, _, rest = line.partition(',')
+            number = number.strip()
+            if not number.lstrip('-').isdigit():
+                continue
+            number = int(number)
+            if number in nodes:
+                continue
+            if favored:
+                favor, comma, name = rest.partition(',')
+                if comma and favor.strip().isdigit():
+                    nodes[number] = _ChannelNode(number, name.strip(), int(favor))
+                    continue
+            nodes[number] = _ChannelNode(number, rest.strip())
+
+    def __readBinaryLineup(self, data, source):
+        """
+        Parses the binary format: a header, fixed-size (number, favor) records, then all names separated by NUL characters.
+
+        Returns:
+        - dict: The channel nodes by channel number.
+        """
+        data = data + source.read()
+        _, count = _LINEUP_HEADER.unpack_from(data)
+        start = _LINEUP_HEADER.size
+        end = start + count * _LINEUP_RECORD.size
+        records = _LINEUP_RECORD.iter_unpack(data[start:end])
+        names = data[end:].decode('utf-8').split('\0')
+        # built back to front so that a repeated channel number keeps its first entry
+        return {number: _ChannelNode(number, name, favor)
+                for (number, favor), name in reversed(list(zip(records, names)))}
+
+    def saveLineup(self, target, binary=False, chunk_size=10000):
+        """
+        Saves the lineup in channel order, formatting chunk_size channels per write.
+
+        File formats:
+        - text: the header line "number,favor,name", then one "number,favor,name" line per channel.
+          The name is the last field, so it may contain commas.
+        - binary: the magic bytes b'RCL1' and the channel count, one (number, favor) record per channel,
+          then the UTF-8 names separated by NUL characters.
+
+        Parameters:
+        - target (str, os.PathLike or file object): A path, or a file object opened in text mode (text) or binary mode (binary).
+        - binary (bool, optional): If True, writes the compact binary format. Defaults to False.
+        - chunk_size (int, optional): Number of channels formatted per write. Defaults to 10000.
+
+        Returns:
+        - int: The number of channels saved.
+        """
+        if isinstance(target, (str, os.PathLike)):
+            if binary:
+                with open(target, 'wb', buffering=1 << 20) as file:
+                    return self.saveLineup(file, binary, chunk_size)
+            with open(target, 'w', encoding='utf-8', newline='\n', buffering=1 << 20) as file:
+                return self.saveLineup(file, binary, chunk_size)
+
+        nodes = list(self.__iterNodes())
+        if binary:
+            target.write(_LINEUP_HEADER.pack(_LINEUP_MAGIC, len(nodes)))
+            pack = _LINEUP_RECORD.pack
+            for start in range(0, len(nodes), chunk_size):
+                target.write(b''.join(pack(node.number, node.favor) for node in nodes[start:start + chunk_size]))
+            for start in range(0, len(nodes), chunk_size):
+                target.write(('\0' if start else '').encode('utf-8') +
+                             '\0'.join(node.name for node in nodes[start:start + chunk_size]).encode('utf-8'))
+        else:
+            target.write(_LINEUP_TEXT_HEADER + '\n')
+            for start in range(0, len(nodes), chunk_size):
+                target.write(''.join(f'{node.number},{node.favor},{node.name}\n' for node in nodes[start:start + chunk_size]))
+        return len(nodes)
 
     def favorChannel(self):
         """
@@ -138,99 +405,66 @@ class RemoteControl:
         Returns:
         - int: 1 if successful, or a message if no channels are available.
         """
-        if not self.__enabledChannelList:
+        if not self.__nodes:
             return "No channels available"
 
-        if len(self.__current_channel) == 3:
-            self.__current_channel[2] += 1
-        else:
-            self.__current_channel.append(1)
-            return 1
+        node = self.__current
+        if node.favor:
+            self.__removeFavor(node)
+        node.favor += 1
+        self.__addFavor(node)
+        return 1
 
     def aiNextChannel(self):
         """
-        Uses AI logic to switch to the next channel based on favor count.
+        Uses AI logic to switch to the next channel based on favor count:
+        the lowest-numbered channel favored one time less than the current channel,
+        or else the lowest-numbered channel with the highest favor count.
 
         Returns:
-        - int: The number of the selected channel, or a message if no channels are available.
+        - int: The number of the selected channel, -1 if no channel is favored, or a message if no channels are available.
         """
-        if not self.__enabledChannelList:
+        if not self.__nodes:
             return "No channels available"
 
-        current_channel_favor = self.__current_channel[2] if len(self.__current_channel) == 3 else 0
-
-        next_channel_num = -1
-        min_channel_num = float('inf')
-        for channel in self.__enabledChannelList:
-            if len(channel) == 3 and channel[2] == current_channel_favor - 1:
-                if channel[0] < min_channel_num:
-                    min_channel_num = channel[0]
-                    next_channel_num = channel[0]
-
-        if next_channel_num == -1:
-            max_favor = 0
-            for channel in self.__enabledChannelList:
-                if len(channel) == 3 and channel[2] > max_favor:
-                    max_favor = channel[2]
-            for channel in self.__enabledChannelList:
-                if len(channel) == 3 and channel[2] == max_favor:
-                    next_channel_num = channel[0]
-                    break
-
-        for channel in self.__enabledChannelList:
-            if channel[0] == next_channel_num:
-                self.__current_channel = channel
-                break
-
-        return next_channel_num
+        bucket = self.__favor_buckets.get(self.__current.favor - 1)
+        if bucket is None:
+            if not self.__favors:
+                return -1
+            bucket = self.__favor_buckets[self.__favors[-1]]
+        self.__current = self.__nodes[bucket[0]]
+        return bucket[0]
 
     def aiPreviousChannel(self):
         """
-        Uses AI logic to switch to the previous channel based on favor count.
+        Uses AI logic to switch to the previous channel based on favor count:
+        the lowest-numbered channel favored one time more than the current channel,
+        or else the lowest-numbered channel with the lowest favor count.
 
         Returns:
-        - int: The number of the selected channel, or a message if no channels are available.
+        - int: The number of the selected channel, -1 if no channel is favored, or a message if no channels are available.
         """
-        if not self.__enabledChannelList:
+        if not self.__nodes:
             return "No channels available"
 
-        current_channel_favor = self.__current_channel[2] if len(self.__current_channel) == 3 else 0
-
-        prev_channel_num = -1
-        min_channel_num = float('inf')
-        for channel in self.__enabledChannelList:
-            if len(channel) == 3 and channel[2] == current_channel_favor + 1:
-                if channel[0] < min_channel_num:
-                    min_channel_num = channel[0]
-                    prev_channel_num = channel[0]
-
-        if prev_channel_num == -1:
-            min_favor = float('inf')
-            for channel in self.__enabledChannelList:
-                if len(channel) == 3 and channel[2] < min_favor:
-                    min_favor = channel[2]
-            for channel in self.__enabledChannelList:
-                if len(channel) == 3 and channel[2] == min_favor:
-                    prev_channel_num = channel[0]
-                    break
-
-        for channel in self.__enabledChannelList:
-            if channel[0] == prev_channel_num:
-                self.__current_channel = channel
-                break
-
-        return prev_channel_num
+        bucket = self.__favor_buckets.get(self.__current.favor + 1)
+        if bucket is None:
+            if not self.__favors:
+                return -1
+            bucket = self.__favor_buckets[self.__favors[0]]
+        self.__current = self.__nodes[bucket[0]]
+        return bucket[0]
 
     def getChannelList(self):
         """
         Retrieves the list of enabled channels.
 
         Returns:
-        - list: The enabled channels, or a message if no channels are available.
+        - list: The enabled channels in lineup order, or a message if no channels are available.
         """
-        if not self.__enabledChannelList:
+        if not self.__nodes:
             return "No channels available"
-        return self.__enabledChannelList
+        return [node.toList() for node in self.__iterNodes()]
 
     def getCurrentChannel(self):
         """
@@ -239,6 +473,256 @@ class RemoteControl:
         Returns:
         - list: The current channel information, or a message if no channel is selected.
         """
-        if not self.__current_channel:
+        if self.__current is None:
             return "No current channel selected"
-        return self.__current_channel
+        return self.__current.toList()
+
+    def replayCommands(self, commands, stats=None):
+        """
+        Applies a compact command log in one call. Zapping commands run inline on the lineup ring,
+        so each command costs far less than calling the matching method.
+
+        Command log format: whitespace-separated tokens, for example "g 5 n n p b u 7 f an ap".
+        - g <number>: gotoChannel; n / p: nextChannel / previousChannel
+        - b: blockChannel; u <number>: unblockChannel; f: favorChannel
+        - an / ap: aiNextChannel / aiPreviousChannel
+
+        Parameters:
+        - commands (str): The command log.
+        - stats (dict, optional): Statistics from an earlier call to add to. Defaults to new statistics.
+
+        Returns:
+        - dict: {'commands': {command: count}, 'visits': {channel number: times shown after a command},
+          'invalid': number of unknown commands or bad channel numbers}.
+        """
+        if stats is None:
+            stats = {'commands': {}, 'visits': {}, 'invalid': 0}
+        self.__replay(commands, stats, None)
+        return stats
+
+    def replaySessions(self, sessions, stats=None):
+        """
+        Replays independent sessions. Each one starts from the lineup as it is now, with the lowest channel current.
+        After a session only the channels it blocked, unblocked or favored are put back,
+        so a session costs O(commands) instead of rebuilding the whole lineup.
+
+        Parameters:
+        - sessions (iterable): Command logs, one string per session (see replayCommands).
+        - stats (dict, optional): Statistics from an earlier call to add to. Defaults to new statistics.
+
+        Returns:
+        - dict: The statistics of all sessions, in the format of replayCommands.
+        """
+        if stats is None:
+            stats = {'commands': {}, 'visits': {}, 'invalid': 0}
+        for commands in sessions:
+            self.__current = self.__head
+            saved = {}
+            self.__replay(commands, stats, saved)
+            for number, original in saved.items():
+                node = self.__nodes.get(number)
+                if node is not None:
+                    self.__unlink(node)
+                if original is not None:
+                    self.__link(_ChannelNode(number, *original))
+        self.__current = self.__head
+        return stats
+
+    def __replay(self, commands, stats, saved):
+        """
+        The replay loop shared by replayCommands and replaySessions.
+
+        Parameters:
+        - commands (str): The command log.
+        - stats (dict): Statistics to add to.
+        - saved (dict or None): If given, the first time a command changes a channel its original (name, favor)
+          is stored here by channel number, or None if the channel was not enabled.
+        """
+        counts = stats['commands']
+        visits = stats['visits']
+        nodes = self.__nodes
+        dispatch = {'b': self.blockChannel, 'f': self.favorChannel, 'an': self.aiNextChannel, 'ap': self.aiPreviousChannel}
+        invalid = 0
+        current = self.__current
+        tokens = iter(commands.split())
+        for command in tokens:
+            if command == 'n':
+                if current is not None:
+                    current = current.next
+            elif command == 'p':
+                if current is not None:
+                    current = current.prev
+            elif command == 'g':
+                argument = next(tokens, '')
+                if not argument.isdigit():
+                    invalid += 1
+                    continue
+                current = nodes.get(int(argument), current)
+            elif command in dispatch:
+                if saved is not None and current is not None and (command == 'b' or command == 'f') \
+                        and current.number not in saved:
+                    saved[current.number] = (current.name, current.favor)
+                self.__current = current
+                dispatch[command]()
+                current = self.__current
+            elif command == 'u':
+                argument = next(tokens, '')
+                if not argument.isdigit():
+                    invalid += 1
+                    continue
+                number = int(argument)
+                if saved is not None and number not in saved:
+                    node = nodes.get(number)
+                    saved[number] = (node.name, node.favor) if node is not None else None
+                self.__current = current
+                self.unblockChannel(number)
+                current = self.__current
+            else:
+                invalid += 1
+                continue
+            counts[command] = counts.get(command, 0) + 1
+            if current is not None:
+                visits[current.number] = visits.get(current.number, 0) + 1
+        self.__current = current
+        stats['invalid'] += invalid
+
+
+_replay_lineup = None
+
+
+def _initReplayWorker(channel_list):
+    """
+    Pool initializer: keeps the lineup in the worker process, so it is sent once instead of with every chunk.
+    """
+    global _replay_lineup
+    _replay_lineup = channel_list
+
+
+def _replaySessions(channel_list, sessions):
+    """
+    Replays sessions one after another on one remote, each starting from the full lineup.
+
+    Parameters:
+    - channel_list (list): The lineup every session starts from.
+    - sessions (list): Command logs, one per session.
+
+    Returns:
+    - tuple: (number of sessions, statistics in the format of RemoteControl.replayCommands).
+    """
+    remote = RemoteControl()
+    remote.powerOnRemoteControl(channel_list)
+    return len(sessions), remote.replaySessions(sessions)
+
+
+def _replaySessionChunk(sessions):
+    """
+    Worker entry point: replays a chunk of sessions on the lineup given to _initReplayWorker.
+    """
+    return _replaySessions(_replay_lineup, sessions)
+
+
+class SessionReplayer:
+    """
+    Class making practice: Replays many recorded remote control sessions and aggregates their statistics.
+    Every session starts from a freshly powered-on remote with the same lineup.
+    Sessions are independent, so chunks of them can be replayed in a process pool.
+    """
+
+    def __init__(self, channel_list, processes=1, chunk_size=1000):
+        """
+        Initializes the replayer.
+
+        Parameters:
+        - channel_list (list): The lineup, in the format of RemoteControl.powerOnRemoteControl.
+        - processes (int, optional): Number of worker processes. Defaults to 1 (replay in this process).
+        - chunk_size (int, optional): Number of sessions sent to a worker at a time. Defaults to 1000.
+        """
+        self.__channel_list = sorted(channel_list)
+        self.__processes = processes
+        self.__chunk_size = chunk_size
+
+    def replay(self, sessions):
+        """
+        Replays sessions and adds up their statistics.
+
+        Parameters:
+        - sessions (iterable): Command logs, one string per session (see RemoteControl.replayCommands).
+
+        Returns:
+        - dict: {'sessions': number of sessions, 'commands': {command: count},
+          'visits': {channel number: times shown after a command}, 'invalid': number of invalid commands}.
+        """
+        total = {'sessions': 0, 'commands': {}, 'visits': {}, 'invalid': 0}
+        sessions = iter(sessions)
+        chunks = iter(lambda: list(islice(sessions, self.__chunk_size)), [])
+        if self.__processes > 1:
+            with multiprocessing.Pool(self.__processes, _initReplayWorker, (self.__channel_list,)) as pool:
+                for count, stats in pool.imap_unordered(_replaySessionChunk, chunks):
+                    self.__merge(total, count, stats)
+        else:
+            for chunk in chunks:
+                self.__merge(total, *_replaySessions(self.__channel_list, chunk))
+        return total
+
+    def replayFile(self, filename):
+        """
+        Replays a command log file holding one session per line. Same return value as replay.
+        """
+        with open(filename, 'r', encoding='utf-8') as file:
+            return self.replay(line for line in file if line.strip())
+
+    def __merge(self, total, count, stats):
+        """
+        Adds the statistics of one chunk to the running total.
+        """
+        total['sessions'] += count
+        for key in ('commands', 'visits'):
+            merged = total[key]
+            for item, value in stats[key].items():
+                merged[item] = merged.get(item, 0) + value
+        total['invalid'] += stats['invalid']
+
+
+def _benchmark(sessions=20000, commands_per_session=200, channels=500):
+    """
+    Times replaying synthetic sessions on a fresh remote with one method call per command,
+    then with SessionReplayer in one process and in a process pool, and prints the results.
+    """
+    rng = random.Random(0)
+    channel_list = [[number, f"Channel {number}"] for number in range(1, channels + 1)]
+    commands = ['n'] * 8 + ['p'] * 4 + ['g'] * 3 + ['f', 'an', 'ap', 'b', 'u']
+    logs = []
+    for _ in range(sessions):
+        tokens = []
+        for command in rng.choices(commands, k=commands_per_session):
+            tokens.append(command)
+            if command == 'g' or command == 'u':
+                tokens.append(str(rng.randint(1, channels)))
+        logs.append(' '.join(tokens))
+
+    methods = {'n': 'nextChannel', 'p': 'previousChannel', 'g': 'gotoChannel', 'b': 'blockChannel',
+               'u': 'unblockChannel', 'f': 'favorChannel', 'an': 'aiNextChannel', 'ap': 'aiPreviousChannel'}
+    start = time.perf_counter()
+    for log in logs:
+        remote = RemoteControl()
+        remote.powerOnRemoteControl(channel_list)
+        tokens = iter(log.split())
+        for command in tokens:
+            if command == 'g' or command == 'u':
+                getattr(remote, methods[command])(int(next(tokens)))
+            else:
+                getattr(remote, methods[command])()
+    per_call = time.perf_counter() - start
+    print(f"{sessions} sessions x {commands_per_session} commands, {channels} channels")
+    print(f"  one method call per command: {per_call:.2f} s")
+
+    for processes in sorted({1, multiprocessing.cpu_count()}):
+        start = time.perf_counter()
+        stats = SessionReplayer(channel_list, processes).replay(logs)
+        elapsed = time.perf_counter() - start
+        print(f"  SessionReplayer, {processes} process(es): {elapsed:.2f} s "
+              f"({sum(stats['commands'].values()) / elapsed:,.0f} commands/s)")
+
+
+if __name__ == "__main__":
+    _benchmark()
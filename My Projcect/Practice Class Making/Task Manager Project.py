@@ -1,3 +1,228 @@
+# import bisect and heapq modules to keep the (deadline, priority) ordering index sorted
+# import date to represent deadlines as proleptic day ordinals
+# import os, tempfile and multiprocessing modules for atomic saves and parallel file parsing
+# import Mapping to build dict-like row views, and numpy (optional) for the columnar task store
+# import threading and contextlib modules for the concurrent task manager
+# import chain to stream a snapshot's header and rows to the file
+import bisect
+import contextlib
+import heapq
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections.abc import Mapping
+from datetime import date
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # only ColumnarTaskManager needs NumPy
+    np = None
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_MIN_ORDINAL = date.min.toordinal()  # 00010101
+_MAX_ORDINAL = date.max.toordinal()  # 99991231
+
+
+def _dateToOrdinal(text):
+    """
+    Converts a YYYYMMDD date string to its proleptic Gregorian day ordinal.
+
+    Parameters:
+    - text (str): The date in YYYYMMDD format.
+
+    Returns:
+    - int: The day ordinal.
+    - int: -1 if text is not a valid date written as exactly 8 ASCII digits.
+    """
+    if not isinstance(text, str) or len(text) != 8 or not (text.isascii() and text.isdigit()):
+        return -1
+    try:
+        return date(int(text[:4]), int(text[4:6]), int(text[6:8])).toordinal()
+    except ValueError:
+        return -1
+
+
+def _ordinalToDate(ordinal):
+    """
+    Converts a proleptic Gregorian day ordinal back to a YYYYMMDD date string.
+    """
+    day = date.fromordinal(ordinal)
+    return f"{day.year:04d}{day.month:02d}{day.day:02d}"
+
+
+def _writeAtomically(filename, chunks):
+    """
+    Writes text chunks to a temporary file in the target's directory, fsyncs it and renames it over the target,
+    so a crash never leaves a half-written file behind.
+
+    Parameters:
+    - filename (str): The file to replace.
+    - chunks (iterable): Strings to write, in order.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix='.tasks-', suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'w', encoding='utf-8', newline='\n', buffering=1 << 20) as file:
+            for chunk in chunks:
+                file.write(chunk)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, filename)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _parseTaskLines(text, first_line_number):
+    """
+    Parses a block of CSV task lines and validates each row like createTask.
+
+    Parameters:
+    - text (str): Whole lines of "student_id,deadline,task_id,priority" records.
+    - first_line_number (int): Line number of the first line in text.
+
+    Returns:
+    - tuple: (rows, errors, line_count) where rows are (line_number, student_id, deadline, task_id, priority)
+      tuples and errors are (line_number, reason) tuples.
+    """
+    rows = []
+    errors = []
+    lines = text.split('\n')
+    if lines and lines[-1] == '':
+        lines.pop()
+    for line_number, line in enumerate(lines, first_line_number):
+        line = line.rstrip('\r')
+        if not line:
+            continue
+        fields = line.split(',')
+        if len(fields) != 4:
+            errors.append((line_number, "expected 4 comma-separated fields"))
+            continue
+        student_id, deadline, task_id, priority = fields
+        try:
+            priority = int(priority)
+        except ValueError:
+            errors.append((line_number, "priority is not an integer"))
+            continue
+        if len(student_id) != 10 or len(deadline) != 8 or len(task_id) != 4 or priority not in (1, 2, 3):
+            errors.append((line_number, "values are not in the correct format"))
+            continue
+        rows.append((line_number, student_id, deadline, task_id, priority))
+    return rows, errors, len(lines)
+
+
+def _parseTaskFileRange(file_range):
+    """
+    Worker entry point: parses the whole lines stored in one byte range of a task file.
+
+    Parameters:
+    - file_range (tuple): (filename, start, end) byte offsets aligned to line starts.
+
+    Returns:
+    - tuple: Same as _parseTaskLines, with line numbers counted from 1 inside the range.
+    """
+    filename, start, end = file_range
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    return _parseTaskLines(text, 1)
+
+
+def _taskFileRanges(filename, chunk_size, start=0):
+    """
+    Splits a task file into byte ranges of about chunk_size bytes that start and end on line boundaries.
+
+    Parameters:
+    - filename (str): The task file.
+    - chunk_size (int): Approximate range size in bytes.
+    - start (int, optional): Byte offset of the first line to include. Defaults to 0.
+
+    Yields:
+    - tuple: (filename, start, end).
+    """
+    size = os.path.getsize(filename)
+    with open(filename, 'rb') as file:
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            file.readline()
+            end = min(file.tell(), size)
+            yield filename, start, end
+            start = end
+
+
+def _snapshotGeneration(filename):
+    """
+    Reads the generation header that TaskManager.saveChanges writes as the first line of its snapshots.
+    The change log next to the snapshot starts with the same generation, which ties the two together.
+
+    Parameters:
+    - filename (str): The task file.
+
+    Returns:
+    - tuple: (generation, header length in bytes), or (None, 0) for a plain CSV file.
+    """
+    with open(filename, 'rb') as file:
+        first = file.readline()
+    if first.startswith(b'#generation,') and first.endswith(b'\n'):
+        return first[len(b'#generation,'):].strip().decode('ascii'), len(first)
+    return None, 0
+
+
+def _replayChangeLog(log_filename, generation, errors, line_offset, manager, set_deadline):
+    """
+    Applies the change log entries written by TaskManager.saveChanges to a loaded snapshot, in order.
+    A torn last line left by a crash is cut off.
+
+    Parameters:
+    - log_filename (str): The change log file.
+    - generation (str): The snapshot's generation; a log that does not start with it is not applied.
+    - errors (list): Entries that cannot be applied are added to it.
+    - line_offset (int): Number of snapshot lines before the first log entry.
+    - manager (TaskManager or ColumnarTaskManager): Receives createTask, deleteTask and updatePriority calls.
+    - set_deadline (callable): Called with (task_id, ordinal) to move an existing task's deadline.
+
+    Returns:
+    - int: The number of complete entries in the log.
+    - int: -1 if the log is missing or belongs to another generation.
+    """
+    try:
+        with open(log_filename, 'rb') as file:
+            data = file.read()
+    except FileNotFoundError:
+        return -1
+    header = f"G,{generation}\n".encode('ascii')
+    if not data.startswith(header):
+        return -1
+    complete = data.rfind(b'\n') + 1
+    if complete < len(data):
+        with open(log_filename, 'r+b') as file:
+            file.truncate(complete)
+    lines = data[len(header):complete].decode('utf-8').split('\n')[:-1]
+    for line_number, line in enumerate(lines, line_offset + 1):
+        fields = line.split(',')
+        kind = fields[0]
+        result = None
+        if kind == 'C' and len(fields) == 5 and fields[4].isdigit():
+            result = manager.createTask(fields[1], fields[2], fields[3], int(fields[4]))
+        elif kind == 'D' and len(fields) == 2:
+            result = manager.deleteTask(fields[1])
+        elif kind == 'P' and len(fields) == 3 and fields[2].isdigit():
+            result = manager.updatePriority(fields[1], int(fields[2]))
+        elif kind == 'T' and len(fields) == 3:
+            ordinal = _dateToOrdinal(fields[2])
+            if ordinal == -1:
+                result = -2
+            else:
+                set_deadline(fields[1], ordinal)
+        else:
+            result = -2
+        if result == -2 or result == -3:
+            errors.append((line_number, "invalid change log entry"))
+    return len(lines)
+
+
 class TaskManager:
     """ 
     Class making practice: Simple task manager which creates, sorts, stores, and retrieves tasks.
@@ -5,16 +230,37 @@ class TaskManager:
     """
     def __init__(self):
         """
-        Initializes the TaskManager class with an empty list to store tasks.
+        Initializes the TaskManager class with empty task storage and indexes.
         Attributes:
-        - __tasks: A private list to store task records.
+        - __tasks: A private dictionary to store task records, keyed by task ID (primary index, creation order).
         Each task is represented as a dictionary with the following keys:
         - 'student_id': A string representing the student's ID (10 digits).
         - 'deadline': A string representing the task deadline in YYYYMMDD format.
         - 'task_id': A string representing the task identifier (4 alphanumeric characters).
         - 'priority': An integer representing the task priority (1, 2, or 3).
+        - __deadlines: A private dictionary holding each deadline as a proleptic day ordinal (task ID -> ordinal).
+          Date arithmetic and ordering use the ordinal; the task's 'deadline' string is kept in sync with it.
+        - __student_tasks: A private dictionary indexing tasks by student (student ID -> {task ID: task}).
+        - __task_order: A private list of (deadline ordinal, priority, sequence, task) entries kept sorted,
+          so the earliest task is the first entry. The sequence number breaks ties in creation order.
+        - __sequences: A private dictionary holding each task's sequence number (task ID -> sequence),
+          so a task's index entry can be found by bisecting on its full key.
+        - __dirty: A private flag set by every change not yet written to disk.
+        - __log_base: The absolute path of the snapshot whose change log saveChanges appends to. None until saveChanges
+          is used (or a snapshot written by it is loaded); changes are only queued for the log while it is set.
+        - __pending: A private list of change log lines recorded since the last save, for saveChanges.
+        - __log_length: The number of entries already in the change log next to __log_base.
         """
-        self.__tasks = []  # Private list to store task records
+        self.__tasks = {}  # Private dictionary to store task records by task ID
+        self.__deadlines = {}
+        self.__student_tasks = {}
+        self.__task_order = []
+        self.__sequences = {}
+        self.__next_sequence = 0
+        self.__dirty = False
+        self.__log_base = None
+        self.__pending = []
+        self.__log_length = 0
 
     def createTask(self, student_id, deadline, task_id, priority):
         """
@@ -29,12 +275,18 @@ class TaskManager:
         Returns:
         - list: The task record if created successfully.
         - int: -1 if the input data types are invalid.
-        - int: -2 if the input values are not in the correct format.
+        - int: -2 if the input values are not in the correct format (including deadlines that are not real dates).
+        - int: -3 if a task with the same task ID already exists.
         """
         if not isinstance(student_id, str) or not isinstance(deadline, str) or not isinstance(task_id, str) or not isinstance(priority, int):
             return -1
         if len(student_id) != 10 or len(deadline) != 8 or len(task_id) != 4 or priority not in [1, 2, 3]:
             return -2
+        ordinal = _dateToOrdinal(deadline)
+        if ordinal == -1:
+            return -2
+        if task_id in self.__tasks:
+            return -3
 
         task = {
             'student_id': student_id,
@@ -42,9 +294,61 @@ class TaskManager:
             'task_id': task_id,
             'priority': priority
         }
-        self.__tasks.append(task)
+        self.__tasks[task_id] = task
+        self.__deadlines[task_id] = ordinal
+        self.__student_tasks.setdefault(student_id, {})[task_id] = task
+        self.__indexTask(task, self.__next_sequence)
+        self.__next_sequence += 1
+        self.__record(f"C,{student_id},{deadline},{task_id},{priority}")
         return task
 
+    def __indexTask(self, task, sequence):
+        """
+        Inserts a task into the ordering index in O(log n) comparisons.
+
+        Parameters:
+        - task (dict): The task record.
+        - sequence (int): The task's creation sequence number, used to break ties.
+        """
+        self.__sequences[task['task_id']] = sequence
+        bisect.insort(self.__task_order, (self.__deadlines[task['task_id']], task['priority'], sequence, task))
+
+    def __moveTask(self, task, ordinal):
+        """
+        Gives a task a new deadline ordinal, keeping its 'deadline' string and its place in the index in sync.
+        The ordinal must lie in [_MIN_ORDINAL, _MAX_ORDINAL]; the date string is made before the index is touched.
+        """
+        deadline = _ordinalToDate(ordinal)
+        sequence = self.__unindexTask(task)
+        self.__deadlines[task['task_id']] = ordinal
+        task['deadline'] = deadline
+        self.__indexTask(task, sequence)
+        self.__record(f"T,{task['task_id']},{task['deadline']}")
+
+    def __record(self, entry):
+        """
+        Marks the manager dirty and, once saveChanges is in use, queues one change log line for it.
+        """
+        self.__dirty = True
+        if self.__log_base is not None:
+            self.__pending.append(entry)
+
+    def __unindexTask(self, task):
+        """
+        Removes a task from the ordering index in O(log n) comparisons. Must be called before its deadline or priority changes.
+        Sequence numbers are unique, so bisecting on (deadline, priority, sequence) lands exactly on the task's entry.
+
+        Parameters:
+        - task (dict): The task record.
+
+        Returns:
+        - int: The task's creation sequence number.
+        """
+        sequence = self.__sequences[task['task_id']]
+        index = bisect.bisect_left(self.__task_order, (self.__deadlines[task['task_id']], task['priority'], sequence))
+        del self.__task_order[index]
+        return sequence
+
     def getTaskByID(self, task_id):
         """
         Retrieves a task by its identifier.
@@ -56,10 +360,7 @@ class TaskManager:
         - list: The task record if found.
         - int: -1 if the task is not found.
         """
-        for task in self.__tasks:
-            if task['task_id'] == task_id:
-                return task
-        return -1
+        return self.__tasks.get(task_id, -1)
 
     def checkDeadline(self, task_id, today_date):
         """
@@ -89,7 +390,7 @@ class TaskManager:
         Returns:
         - list: The updated task record if successful.
         - int: -1 if the task is not found.
-        - int: -2 if the delay exceeds 14 days.
+        - int: -2 if the delay exceeds 14 days or would move the deadline outside the years 0001-9999.
         """
         if delay > 14:
             return -2
@@ -98,18 +399,92 @@ class TaskManager:
         if task == -1:
             return -1
 
-        year, month, day = int(task['deadline'][:4]), int(task['deadline'][4:6]), int(task['deadline'][6:8])
-        day += delay
+        ordinal = self.__deadlines[task_id] + delay
+        if not _MIN_ORDINAL <= ordinal <= _MAX_ORDINAL:
+            return -2
+        self.__moveTask(task, ordinal)
+        return task
+
+    def deferDeadlines(self, task_ids, delay):
+        """
+        Defers the deadlines of many tasks by the same number of days in one pass.
+        Unknown task IDs are ignored.
 
-        if day > 31:
-            day -= 31
-            month += 1
-            if month > 12:
-                month = 1
-                year += 1
+        Parameters:
+        - task_ids (iterable): The identifiers of the tasks to update.
+        - delay (int): The number of days to extend the deadlines (1-14 days).
 
-        task['deadline'] = f"{year:04d}{month:02d}{day:02d}"
-        return task
+        Returns:
+        - int: The number of tasks deferred.
+        - int: -2 if the delay exceeds 14 days or would move a deadline outside the years 0001-9999
+          (no task is changed then).
+        """
+        if delay > 14:
+            return -2
+        tasks = [self.__tasks[task_id] for task_id in dict.fromkeys(task_ids) if task_id in self.__tasks]
+        return self.__deferTasks(tasks, delay)
+
+    def deferStudentDeadlines(self, student_id, delay):
+        """
+        Defers the deadlines of every task of a student. Same return values as deferDeadlines.
+        """
+        if delay > 14:
+            return -2
+        tasks = list(self.__student_tasks.get(student_id, {}).values())
+        return self.__deferTasks(tasks, delay)
+
+    def deferDeadlinesBetween(self, start_date, end_date, delay):
+        """
+        Defers the deadlines of every task due in a date range (both ends inclusive). Same return values as deferDeadlines,
+        and -2 if either date is not a valid date.
+        """
+        if delay > 14:
+            return -2
+        tasks = self.getTasksDueBetween(start_date, end_date)
+        if tasks == -2:
+            return -2
+        return self.__deferTasks(tasks, delay)
+
+    def __deferTasks(self, tasks, delay):
+        """
+        Moves the deadlines of distinct tasks and repairs the ordering index.
+        A few tasks are re-inserted one by one; larger batches take one partition pass over the index,
+        re-sort only the moved entries and merge them back in O(n + k log k).
+
+        Parameters:
+        - tasks (list): Distinct task records to update.
+        - delay (int): The number of days to add.
+
+        Returns:
+        - int: The number of tasks deferred.
+        - int: -2 if a deadline would leave the supported date range; nothing is changed then.
+        """
+        deadlines = self.__deadlines
+        if tasks:
+            ordinals = [deadlines[task['task_id']] for task in tasks]
+            if min(ordinals) + delay < _MIN_ORDINAL or max(ordinals) + delay > _MAX_ORDINAL:
+                return -2
+        if len(tasks) * 32 < len(self.__task_order):
+            for task in tasks:
+                self.__moveTask(task, deadlines[task['task_id']] + delay)
+            return len(tasks)
+
+        moved_ids = {task['task_id'] for task in tasks}
+        kept = []
+        moved = []
+        for entry in self.__task_order:
+            task = entry[3]
+            if task['task_id'] in moved_ids:
+                ordinal = entry[0] + delay
+                deadlines[task['task_id']] = ordinal
+                task['deadline'] = _ordinalToDate(ordinal)
+                moved.append((ordinal, entry[1], entry[2], task))
+                self.__record(f"T,{task['task_id']},{task['deadline']}")
+            else:
+                kept.append(entry)
+        moved.sort()
+        self.__task_order = list(heapq.merge(kept, moved))
+        return len(tasks)
 
     def getEarliestTask(self):
         """
@@ -119,15 +494,9 @@ class TaskManager:
         - list: The task with the earliest deadline.
         - int: -1 if there are no tasks.
         """
-        if not self.__tasks:
+        if not self.__task_order:
             return -1
-
-        earliest_task = self.__tasks[0]
-        for task in self.__tasks:
-            if task['deadline'] < earliest_task['deadline'] or (
-                task['deadline'] == earliest_task['deadline'] and task['priority'] < earliest_task['priority']):
-                earliest_task = task
-        return earliest_task
+        return self.__task_order[0][3]
 
     def getTasksSorted(self, reverse=False):
         """
@@ -139,42 +508,229 @@ class TaskManager:
         Returns:
         - list: A list of sorted tasks.
         """
-        sorted_tasks = []
-        tasks_copy = self.__tasks[:]
-
-        while tasks_copy:
-            earliest = self.getEarliestTask()
-            sorted_tasks.append(earliest)
-            tasks_copy.remove(earliest)
+        sorted_tasks = [entry[3] for entry in self.__task_order]
 
         if reverse:
             sorted_tasks.reverse()
 
         return sorted_tasks
 
-    def saveToFile(self, filename):
+    def getTopTasks(self, k):
+        """
+        Retrieves the k tasks that come first by deadline and priority.
+
+        Parameters:
+        - k (int): The number of tasks to retrieve.
+
+        Returns:
+        - list: Up to k tasks, earliest first.
+        """
+        return [entry[3] for entry in self.__task_order[:k]]
+
+    def getIndexEntry(self, task_id):
+        """
+        Retrieves a task's entry in the ordering index, so other views can order tasks exactly as this manager does.
+
+        Parameters:
+        - task_id (str): The identifier of the task.
+
+        Returns:
+        - tuple: (deadline ordinal, priority, sequence, task). The task is the live record and must not be modified.
+        - int: -1 if the task is not found.
+        """
+        task = self.__tasks.get(task_id)
+        if task is None:
+            return -1
+        return (self.__deadlines[task_id], task['priority'], self.__sequences[task_id], task)
+
+    def getIndexes(self):
+        """
+        Retrieves the ordering and student indexes, for building views of all tasks without re-sorting.
+
+        Returns:
+        - tuple: (index entries sorted by deadline and priority, {student ID: {task ID: task}} in creation order).
+          Both are the live indexes and must not be modified.
+        """
+        return self.__task_order, self.__student_tasks
+
+    def saveToFile(self, filename, chunk_size=10000):
         """
         Saves all task records to a CSV file.
+        Rows are written in buffered chunks to a temporary file in the same directory, which then atomically
+        replaces the target, so a crash never leaves a half-written file behind.
+        If saveChanges was keeping a change log for this file, the log is dropped and change logging stops
+        until saveChanges is called again.
 
         Parameters:
         - filename (str): The name of the file to save the tasks.
+        - chunk_size (int, optional): Number of rows formatted per write. Defaults to 10000.
+        """
+        self.__writeSnapshot(filename, chunk_size, '')
+        if self.__log_base == os.path.abspath(filename):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(filename + '.log')
+            self.__log_base = None
+            self.__pending = []
+            self.__log_length = 0
+        self.__dirty = False
+
+    def __writeSnapshot(self, filename, chunk_size, header):
+        """
+        Atomically writes header followed by one CSV row per task.
         """
-        with open(filename, 'w') as file:
-            for task in self.__tasks:
-                file.write(f"{task['student_id']},{task['deadline']},{task['task_id']},{task['priority']}\n")
+        tasks = list(self.__tasks.values())
+        _writeAtomically(filename, chain([header], (''.join(f"{task['student_id']},{task['deadline']},{task['task_id']},{task['priority']}\n"
+                                                            for task in tasks[start:start + chunk_size])
+                                                    for start in range(0, len(tasks), chunk_size))))
 
-    def loadFromFile(self, filename):
+    def saveChanges(self, filename, compact_every=10000):
         """
-        Loads task records from a CSV file.
+        Saves only what changed since the last save by appending create, delete, priority and deadline events
+        to the change log filename + '.log'.
+        Each call costs O(changes); once the log holds more entries than both compact_every and the number of tasks,
+        it is compacted into a fresh snapshot, which keeps the amortized cost per change O(1).
+        The first call for a file (unless the tasks were loaded from a snapshot written by saveChanges) writes a full snapshot.
+
+        Snapshots written here start with a "#generation,<id>" line and the log starts with "G,<id>".
+        A new generation's snapshot replaces the old one before its empty log replaces the old log,
+        so after a crash in between, loadFromFile sees that the old log does not match the snapshot and ignores it.
+
+        Parameters:
+        - filename (str): The snapshot file the changes belong to.
+        - compact_every (int, optional): Minimum number of log entries before compaction. Defaults to 10000.
+
+        Returns:
+        - int: The number of change log entries written (0 when a full snapshot was written or nothing changed).
+        """
+        if self.__log_base != os.path.abspath(filename) or \
+                self.__log_length + len(self.__pending) > max(compact_every, len(self.__tasks)):
+            generation = os.urandom(8).hex()
+            self.__writeSnapshot(filename, 10000, f"#generation,{generation}\n")
+            _writeAtomically(filename + '.log', [f"G,{generation}\n"])
+            self.__log_base = os.path.abspath(filename)
+            self.__pending = []
+            self.__log_length = 0
+            self.__dirty = False
+            return 0
+        if not self.__pending:
+            self.__dirty = False
+            return 0
+        with open(filename + '.log', 'a', encoding='utf-8', newline='\n') as file:
+            file.write('\n'.join(self.__pending) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        written = len(self.__pending)
+        self.__log_length += written
+        self.__pending = []
+        self.__dirty = False
+        return written
+
+    def hasUnsavedChanges(self):
+        """
+        Returns:
+        - bool: True if tasks changed since they were last saved or loaded.
+        """
+        return self.__dirty
+
+    def loadFromFile(self, filename, workers=1, chunk_size=1 << 22):
+        """
+        Loads task records from a CSV file, replacing the current tasks.
+        The file is streamed in chunks of whole lines, so memory stays bounded by the chunk size plus the tasks.
+        Invalid rows and repeated task IDs are skipped and reported instead of stopping the load.
+        If the file is a snapshot written by saveChanges, its change log (filename + '.log') is replayed on top of it,
+        provided the log belongs to the same generation; a stale log left by a crash during compaction is ignored.
 
         Parameters:
         - filename (str): The name of the file to load the tasks from.
+        - workers (int, optional): Number of worker processes that parse chunks in parallel. Defaults to 1 (no workers).
+        - chunk_size (int, optional): Approximate chunk size in bytes. Defaults to 4 MiB.
+
+        Returns:
+        - list: (line_number, reason) for every row that was skipped; empty if all rows were loaded.
+          Change log entries are numbered after the snapshot's last line.
+        """
+        self.__tasks = {}
+        self.__deadlines = {}
+        self.__student_tasks = {}
+        self.__task_order = []
+        self.__sequences = {}
+        self.__log_base = None
+        errors = []
+        generation, header_size = _snapshotGeneration(filename)
+        line_offset = 1 if header_size else 0
+        ranges = _taskFileRanges(filename, chunk_size, header_size)
+        if workers > 1:
+            with multiprocessing.Pool(workers) as pool:
+                for rows, chunk_errors, line_count in pool.imap(_parseTaskFileRange, ranges):
+                    self.__loadRows(rows, chunk_errors)
+                    errors.extend((line_number + line_offset, reason) for line_number, reason in chunk_errors)
+                    line_offset += line_count
+        else:
+            for file_range in ranges:
+                rows, chunk_errors, line_count = _parseTaskFileRange(file_range)
+                self.__loadRows(rows, chunk_errors)
+                errors.extend((line_number + line_offset, reason) for line_number, reason in chunk_errors)
+                line_offset += line_count
+        self.__task_order.sort()
+        errors.sort()
+        if generation is not None:
+            log_length = self.__replayChangeLog(filename + '.log', generation, errors, line_offset)
+            if log_length != -1:
+                # keep appending to this generation's log; otherwise the next saveChanges starts a new generation
+                self.__log_base = os.path.abspath(filename)
+                self.__log_length = log_length
+        self.__pending = []
+        self.__dirty = False
+        return errors
+
+    def __replayChangeLog(self, log_filename, generation, errors, line_offset):
         """
-        self.__tasks = []
-        with open(filename, 'r') as file:
-            for line in file:
-                student_id, deadline, task_id, priority = line.strip().split(',')
-                self.createTask(student_id, deadline, task_id, int(priority))
+        Applies the change log to the loaded snapshot. Same parameters and return values as _replayChangeLog.
+        """
+        return _replayChangeLog(log_filename, generation, errors, line_offset, self, self.__setDeadline)
+
+    def __setDeadline(self, task_id, ordinal):
+        """
+        Moves a task, if it exists, to a deadline ordinal read from the change log.
+        """
+        task = self.__tasks.get(task_id)
+        if task is not None:
+            self.__moveTask(task, ordinal)
+
+    def __loadRows(self, rows, errors):
+        """
+        Inserts parsed, validated rows without re-checking their types.
+        The ordering index is only appended to here; loadFromFile sorts it once at the end.
+
+        Parameters:
+        - rows (list): (line_number, student_id, deadline, task_id, priority) tuples.
+        - errors (list): Chunk error list; invalid dates and repeated task IDs are added to it.
+        """
+        tasks = self.__tasks
+        deadlines = self.__deadlines
+        student_tasks = self.__student_tasks
+        task_order = self.__task_order
+        sequences = self.__sequences
+        ordinal_of = {}  # deadlines repeat a lot, so each distinct date string is converted once
+        sequence = self.__next_sequence
+        for line_number, student_id, deadline, task_id, priority in rows:
+            ordinal = ordinal_of.get(deadline)
+            if ordinal is None:
+                ordinal = ordinal_of[deadline] = _dateToOrdinal(deadline)
+            if ordinal == -1:
+                errors.append((line_number, "values are not in the correct format"))
+                continue
+            if task_id in tasks:
+                errors.append((line_number, "duplicate task ID"))
+                continue
+            task = {'student_id': student_id, 'deadline': deadline, 'task_id': task_id, 'priority': priority}
+            tasks[task_id] = task
+            deadlines[task_id] = ordinal
+            student_tasks.setdefault(student_id, {})[task_id] = task
+            task_order.append((ordinal, priority, sequence, task))
+            sequences[task_id] = sequence
+            sequence += 1
+        self.__next_sequence = sequence
 
     def checkPriority(self, task_id):
         """
@@ -203,8 +759,8 @@ class TaskManager:
         - list: A list of tasks associated with the student ID.
         - int: -1 if no tasks are found.
         """
-        tasks_by_student = [task for task in self.__tasks if task['student_id'] == student_id]
-        return tasks_by_student if tasks_by_student else -1
+        tasks_by_student = self.__student_tasks.get(student_id)
+        return list(tasks_by_student.values()) if tasks_by_student else -1
 
     def deleteTask(self, task_id):
         """
@@ -217,11 +773,18 @@ class TaskManager:
         - list: The deleted task record if successful.
         - int: -1 if the task is not found.
         """
-        for task in self.__tasks:
-            if task['task_id'] == task_id:
-                self.__tasks.remove(task)
-                return task
-        return -1
+        task = self.__tasks.pop(task_id, None)
+        if task is None:
+            return -1
+        tasks_by_student = self.__student_tasks[task['student_id']]
+        del tasks_by_student[task_id]
+        if not tasks_by_student:
+            del self.__student_tasks[task['student_id']]
+        self.__unindexTask(task)
+        del self.__deadlines[task_id]
+        del self.__sequences[task_id]
+        self.__record(f"D,{task_id}")
+        return task
 
     def updatePriority(self, task_id, new_priority):
         """
@@ -243,7 +806,10 @@ class TaskManager:
         if task == -1:
             return -1
 
+        sequence = self.__unindexTask(task)
         task['priority'] = new_priority
+        self.__indexTask(task, sequence)
+        self.__record(f"P,{task_id},{new_priority}")
         return task
 
     def countTasks(self):
@@ -263,6 +829,1019 @@ class TaskManager:
         - today_date (str): Today's date in YYYYMMDD format.
 
         Returns:
-        - list: A list of overdue tasks.
+        - list: A list of overdue tasks, earliest deadline first.
+        - int: -2 if today_date is not a valid date.
+        """
+        today = _dateToOrdinal(today_date)
+        if today == -1:
+            return -2
+        end = bisect.bisect_left(self.__task_order, (today,))
+        return [entry[3] for entry in self.__task_order[:end]]
+
+    def getTasksDueBetween(self, start_date, end_date):
+        """
+        Retrieves all tasks whose deadline falls in a date range, in O(log n + k).
+
+        Parameters:
+        - start_date (str): First date of the range in YYYYMMDD format (inclusive).
+        - end_date (str): Last date of the range in YYYYMMDD format (inclusive).
+
+        Returns:
+        - list: A list of tasks due in the range, earliest deadline first.
+        - int: -2 if either date is not a valid date.
+        """
+        start = _dateToOrdinal(start_date)
+        end = _dateToOrdinal(end_date)
+        if start == -1 or end == -1:
+            return -2
+        return self.__tasksDueBetween(start, end)
+
+    def __tasksDueBetween(self, start, end):
+        """
+        Returns:
+        - list: Tasks whose deadline ordinal lies in [start, end], earliest deadline first.
+        """
+        first = bisect.bisect_left(self.__task_order, (start,))
+        last = bisect.bisect_left(self.__task_order, (end + 1,))
+        return [entry[3] for entry in self.__task_order[first:last]]
+
+    def getTasksDueWithin(self, today_date, days):
+        """
+        Retrieves all tasks due from today through the next given number of days.
+
+        Parameters:
+        - today_date (str): Today's date in YYYYMMDD format.
+        - days (int): Number of days after today to include.
+
+        Returns:
+        - list: A list of tasks due in the window, earliest deadline first.
+        - int: -2 if today_date is not a valid date.
+        """
+        today = _dateToOrdinal(today_date)
+        if today == -1:
+            return -2
+        return self.__tasksDueBetween(today, today + days)
+
+
+class _TaskRowView(Mapping):
+    """
+    Read-only, dict-like view of one task stored in a ColumnarTaskManager.
+    Values are read from the columns when accessed, so creating a view costs O(1).
+    """
+
+    __slots__ = ("__task_id", "__read")
+
+    KEYS = ('student_id', 'deadline', 'task_id', 'priority')
+
+    def __init__(self, task_id, read):
+        """
+        Parameters:
+        - task_id (str): Identifier of the viewed task.
+        - read (callable): read(task_id, key) returns one value of the task.
+        """
+        self.__task_id = task_id
+        self.__read = read
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return self.__read(self.__task_id, key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class ColumnarTaskManager:
+    """
+    Class making practice: TaskManager with a columnar, NumPy-backed task store.
+    Deadlines are kept as integer day ordinals, priorities as uint8 and IDs as fixed-width byte strings,
+    so a task costs a few dozen bytes and overdue, per-student and sorted queries run as vectorized masks and sorts.
+    Methods match TaskManager; tasks are returned as read-only dict-like row views.
+    Requires NumPy.
+    """
+
+    def __init__(self, capacity=1024):
+        """
+        Initializes empty columns.
+
+        Parameters:
+        - capacity (int, optional): Number of rows to allocate up front. Defaults to 1024.
+
+        Attributes:
+        - __student_ids / __task_ids: Private 'S10' / 'S4' columns of IDs.
+        - __deadlines: A private int32 column of deadlines as proleptic Gregorian day ordinals.
+        - __priorities: A private uint8 column of priorities.
+        - __alive: A private bool column; deleted rows stay in place as False until the columns are compacted.
+        - __rows: A private dictionary mapping task ID to its row, for O(1) lookups.
+        - __size: Number of rows in use, including deleted ones.
+        """
+        if np is None:
+            raise ImportError("ColumnarTaskManager requires NumPy")
+        self.__clear(capacity)
+
+    def __clear(self, capacity):
+        """
+        Replaces all columns with empty ones of the given capacity.
+        """
+        self.__student_ids = np.zeros(capacity, dtype='S10')
+        self.__task_ids = np.zeros(capacity, dtype='S4')
+        self.__deadlines = np.zeros(capacity, dtype=np.int32)
+        self.__priorities = np.zeros(capacity, dtype=np.uint8)
+        self.__alive = np.zeros(capacity, dtype=bool)
+        self.__rows = {}
+        self.__size = 0
+
+    def __reserve(self, extra):
+        """
+        Grows every column, at least doubling, so that extra more rows fit.
+        """
+        needed = self.__size + extra
+        capacity = len(self.__alive)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        self.__student_ids = self.__grown(self.__student_ids, capacity)
+        self.__task_ids = self.__grown(self.__task_ids, capacity)
+        self.__deadlines = self.__grown(self.__deadlines, capacity)
+        self.__priorities = self.__grown(self.__priorities, capacity)
+        self.__alive = self.__grown(self.__alive, capacity)
+
+    def __grown(self, column, capacity):
+        """
+        Returns:
+        - ndarray: A copy of the used part of column in a new array of the given capacity.
+        """
+        new_column = np.zeros(capacity, dtype=column.dtype)
+        new_column[:self.__size] = column[:self.__size]
+        return new_column
+
+    def __compact(self):
+        """
+        Drops deleted rows once they make up more than half of the used rows, keeping creation order.
+        """
+        if 2 * len(self.__rows) >= self.__size:
+            return
+        keep = np.nonzero(self.__alive[:self.__size])[0]
+        count = len(keep)
+        for column in (self.__student_ids, self.__task_ids, self.__deadlines, self.__priorities, self.__alive):
+            column[:count] = column[keep]
+            column[count:self.__size] = 0
+        self.__size = count
+        self.__rows = {task_id.decode(): row for row, task_id in enumerate(self.__task_ids[:count].tolist())}
+
+    def __readCell(self, task_id, key):
+        """
+        Reads one value of a task for _TaskRowView.
+        """
+        row = self.__rows[task_id]
+        if key == 'task_id':
+            return task_id
+        if key == 'student_id':
+            return self.__student_ids[row].decode()
+        if key == 'deadline':
+            return _ordinalToDate(int(self.__deadlines[row]))
+        return int(self.__priorities[row])
+
+    def __view(self, task_id):
+        return _TaskRowView(task_id, self.__readCell)
+
+    def __views(self, rows):
+        """
+        Returns:
+        - list: Row views for an array of row numbers, in the given order.
+        """
+        return [self.__view(task_id.decode()) for task_id in self.__task_ids[rows].tolist()]
+
+    def __sortedRows(self, mask):
+        """
+        Returns:
+        - ndarray: Rows selected by mask, ordered by deadline, priority and creation.
+        """
+        rows = np.nonzero(mask)[0]
+        order = np.lexsort((self.__priorities[rows], self.__deadlines[rows]))
+        return rows[order]
+
+    def __liveMask(self):
+        return self.__alive[:self.__size]
+
+    def createTask(self, student_id, deadline, task_id, priority):
+        """
+        Creates a task record and validates the input data. Same return values as TaskManager.createTask,
+        except that a created task is returned as a row view; a deadline that is not a real date is a format error (-2).
+        """
+        if not isinstance(student_id, str) or not isinstance(deadline, str) or not isinstance(task_id, str) or not isinstance(priority, int):
+            return -1
+        if len(student_id) != 10 or len(deadline) != 8 or len(task_id) != 4 or priority not in [1, 2, 3]:
+            return -2
+        ordinal = _dateToOrdinal(deadline)
+        if ordinal == -1 or not student_id.isascii() or not task_id.isascii():
+            return -2
+        if task_id in self.__rows:
+            return -3
+        self.__reserve(1)
+        row = self.__size
+        self.__student_ids[row] = student_id
+        self.__task_ids[row] = task_id
+        self.__deadlines[row] = ordinal
+        self.__priorities[row] = priority
+        self.__alive[row] = True
+        self.__rows[task_id] = row
+        self.__size += 1
+        return self.__view(task_id)
+
+    def getTaskByID(self, task_id):
+        """
+        Same return values as TaskManager.getTaskByID.
+        """
+        if task_id not in self.__rows:
+            return -1
+        return self.__view(task_id)
+
+    def checkDeadline(self, task_id, today_date):
+        """
+        Same return values as TaskManager.checkDeadline.
+        """
+        task = self.getTaskByID(task_id)
+        if task == -1:
+            return -1
+        return task['deadline'] >= today_date
+
+    def deferDeadline(self, task_id, delay):
+        """
+        Same return values as TaskManager.deferDeadline. Days are added on the calendar.
+        """
+        if delay > 14:
+            return -2
+        row = self.__rows.get(task_id)
+        if row is None:
+            return -1
+        if self.__shiftDeadlines([row], delay) == -2:
+            return -2
+        return self.__view(task_id)
+
+    def deferDeadlines(self, task_ids, delay):
+        """
+        Same return values as TaskManager.deferDeadlines, applied with one vectorized add.
+        """
+        if delay > 14:
+            return -2
+        rows = np.fromiter((self.__rows[task_id] for task_id in dict.fromkeys(task_ids) if task_id in self.__rows), dtype=np.int64)
+        return self.__shiftDeadlines(rows, delay)
+
+    def deferStudentDeadlines(self, student_id, delay):
+        """
+        Same return values as TaskManager.deferStudentDeadlines, applied with one vectorized mask.
+        """
+        if delay > 14:
+            return -2
+        if not isinstance(student_id, str) or not student_id.isascii():
+            return 0
+        mask = self.__liveMask() & (self.__student_ids[:self.__size] == student_id.encode())
+        return self.__shiftDeadlines(mask, delay)
+
+    def deferDeadlinesBetween(self, start_date, end_date, delay):
+        """
+        Same return values as TaskManager.deferDeadlinesBetween, applied with one vectorized mask.
+        """
+        if delay > 14:
+            return -2
+        start = _dateToOrdinal(start_date)
+        end = _dateToOrdinal(end_date)
+        if start == -1 or end == -1:
+            return -2
+        deadlines = self.__deadlines[:self.__size]
+        mask = self.__liveMask() & (deadlines >= start) & (deadlines <= end)
+        return self.__shiftDeadlines(mask, delay)
+
+    def __shiftDeadlines(self, index, delay):
+        """
+        Adds delay to the deadlines selected by index (row numbers or a mask over the used rows), all or nothing.
+
+        Returns:
+        - int: The number of deadlines moved.
+        - int: -2 if one would leave the years 0001-9999; nothing is changed then.
+        """
+        deadlines = self.__deadlines[:self.__size]
+        moved = deadlines[index].astype(np.int64) + delay
+        if moved.size and (moved.min() < _MIN_ORDINAL or moved.max() > _MAX_ORDINAL):
+            return -2
+        deadlines[index] = moved
+        return int(moved.size)
+
+    def getEarliestTask(self):
+        """
+        Same return values as TaskManager.getEarliestTask.
+        """
+        if not self.__rows:
+            return -1
+        keys = self.__deadlines[:self.__size].astype(np.int64) * 4 + self.__priorities[:self.__size]
+        keys[~self.__liveMask()] = np.iinfo(np.int64).max
+        return self.__view(self.__task_ids[np.argmin(keys)].decode())
+
+    def getTasksSorted(self, reverse=False):
+        """
+        Same return values as TaskManager.getTasksSorted.
+        """
+        rows = self.__sortedRows(self.__liveMask())
+        return self.__views(rows[::-1] if reverse else rows)
+
+    def getTopTasks(self, k):
+        """
+        Same return values as TaskManager.getTopTasks, found with a partial sort in O(n + k log k).
+        """
+        rows = np.nonzero(self.__liveMask())[0]
+        if k <= 0 or len(rows) == 0:
+            return []
+        keys = (self.__deadlines[rows].astype(np.int64) * 4 + self.__priorities[rows]) * self.__size + rows
+        if k < len(rows):
+            selected = np.argpartition(keys, k - 1)[:k]
+        else:
+            selected = np.arange(len(rows))
+        selected = selected[np.argsort(keys[selected])]
+        return self.__views(rows[selected])
+
+    def saveToFile(self, filename, chunk_size=100000):
+        """
+        Saves all task records to a CSV file atomically, formatting each chunk of rows with vectorized conversions.
+
+        Parameters:
+        - filename (str): The name of the file to save the tasks.
+        - chunk_size (int, optional): Number of rows formatted per write. Defaults to 100000.
+        """
+        rows = np.nonzero(self.__liveMask())[0]
+        epoch = _EPOCH_ORDINAL
+
+        def chunks():
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                days = (self.__deadlines[chunk].astype(np.int64) - epoch).astype('datetime64[D]')
+                deadlines = np.char.replace(np.datetime_as_string(days, unit='D'), '-', '')
+                yield ''.join(f"{student_id.decode()},{deadline},{task_id.decode()},{priority}\n"
+                              for student_id, deadline, task_id, priority in zip(
+                                  self.__student_ids[chunk].tolist(), deadlines.tolist(),
+                                  self.__task_ids[chunk].tolist(), self.__priorities[chunk].tolist()))
+
+        _writeAtomically(filename, chunks())
+
+    def loadFromFile(self, filename, workers=1, chunk_size=1 << 22):
+        """
+        Loads task records from a CSV file, replacing the current tasks, writing each parsed chunk into
+        the columns in bulk. Same parameters and return value as TaskManager.loadFromFile,
+        including replaying the change log of a snapshot written by TaskManager.saveChanges.
+        """
+        self.__clear(1024)
+        errors = []
+        generation, header_size = _snapshotGeneration(filename)
+        line_offset = 1 if header_size else 0
+        ranges = _taskFileRanges(filename, chunk_size, header_size)
+        if workers > 1:
+            with multiprocessing.Pool(workers) as pool:
+                for rows, chunk_errors, line_count in pool.imap(_parseTaskFileRange, ranges):
+                    self.__loadRows(rows, chunk_errors)
+                    errors.extend((line_number + line_offset, reason) for line_number, reason in chunk_errors)
+                    line_offset += line_count
+        else:
+            for file_range in ranges:
+                rows, chunk_errors, line_count = _parseTaskFileRange(file_range)
+                self.__loadRows(rows, chunk_errors)
+                errors.extend((line_number + line_offset, reason) for line_number, reason in chunk_errors)
+                line_offset += line_count
+        errors.sort()
+        if generation is not None:
+            _replayChangeLog(filename + '.log', generation, errors, line_offset, self, self.__setDeadline)
+        return errors
+
+    def __setDeadline(self, task_id, ordinal):
+        """
+        Moves a task, if it exists, to a deadline ordinal read from the change log.
+        """
+        row = self.__rows.get(task_id)
+        if row is not None:
+            self.__deadlines[row] = ordinal
+
+    def __loadRows(self, rows, errors):
+        """
+        Appends parsed, validated rows to the columns in bulk.
+
+        Parameters:
+        - rows (list): (line_number, student_id, deadline, task_id, priority) tuples.
+        - errors (list): Chunk error list; invalid dates and repeated task IDs are added to it.
+        """
+        known_rows = self.__rows
+        ordinal_of = {}  # deadlines repeat a lot, so each distinct date string is converted once
+        accepted = []
+        ordinals = []
+        for row in rows:
+            line_number, student_id, deadline, task_id = row[:4]
+            ordinal = ordinal_of.get(deadline)
+            if ordinal is None:
+                ordinal = ordinal_of[deadline] = _dateToOrdinal(deadline)
+            if ordinal == -1 or not student_id.isascii() or not task_id.isascii():
+                errors.append((line_number, "values are not in the correct format"))
+                continue
+            if task_id in known_rows:
+                errors.append((line_number, "duplicate task ID"))
+                continue
+            known_rows[task_id] = self.__size + len(accepted)
+            accepted.append(row)
+            ordinals.append(ordinal)
+        if not accepted:
+            return
+        count = len(accepted)
+        self.__reserve(count)
+        start, end = self.__size, self.__size + count
+        _, student_ids, _, task_ids, priorities = zip(*accepted)
+        self.__student_ids[start:end] = student_ids
+        self.__task_ids[start:end] = task_ids
+        self.__deadlines[start:end] = ordinals
+        self.__priorities[start:end] = priorities
+        self.__alive[start:end] = True
+        self.__size = end
+
+    def checkPriority(self, task_id):
+        """
+        Same return values as TaskManager.checkPriority.
+        """
+        task = self.getTaskByID(task_id)
+        if task == -1:
+            return -1
+        return task['priority'] in [1, 2, 3]
+
+    def getTaskByStudentID(self, student_id):
+        """
+        Same return values as TaskManager.getTaskByStudentID, found with a vectorized mask.
+        """
+        if not isinstance(student_id, str) or not student_id.isascii():
+            return -1
+        mask = self.__liveMask() & (self.__student_ids[:self.__size] == student_id.encode())
+        tasks_by_student = self.__views(np.nonzero(mask)[0])
+        return tasks_by_student if tasks_by_student else -1
+
+    def deleteTask(self, task_id):
+        """
+        Same return values as TaskManager.deleteTask. The deleted task is returned as a plain dictionary.
+        """
+        if task_id not in self.__rows:
+            return -1
+        task = dict(self.__view(task_id))
+        self.__alive[self.__rows.pop(task_id)] = False
+        self.__compact()
+        return task
+
+    def updatePriority(self, task_id, new_priority):
+        """
+        Same return values as TaskManager.updatePriority.
+        """
+        if new_priority not in [1, 2, 3]:
+            return -2
+        row = self.__rows.get(task_id)
+        if row is None:
+            return -1
+        self.__priorities[row] = new_priority
+        return self.__view(task_id)
+
+    def countTasks(self):
+        """
+        Same return value as TaskManager.countTasks.
+        """
+        return len(self.__rows)
+
+    def getOverdueTasks(self, today_date):
+        """
+        Same return values as TaskManager.getOverdueTasks, found with a vectorized mask.
+        """
+        today = _dateToOrdinal(today_date)
+        if today == -1:
+            return -2
+        mask = self.__liveMask() & (self.__deadlines[:self.__size] < today)
+        return self.__views(self.__sortedRows(mask))
+
+    def getTasksDueBetween(self, start_date, end_date):
+        """
+        Same return values as TaskManager.getTasksDueBetween, found with a vectorized mask.
+        """
+        start = _dateToOrdinal(start_date)
+        end = _dateToOrdinal(end_date)
+        if start == -1 or end == -1:
+            return -2
+        deadlines = self.__deadlines[:self.__size]
+        mask = self.__liveMask() & (deadlines >= start) & (deadlines <= end)
+        return self.__views(self.__sortedRows(mask))
+
+    def getTasksDueWithin(self, today_date, days):
+        """
+        Same return values as TaskManager.getTasksDueWithin.
+        """
+        today = _dateToOrdinal(today_date)
+        if today == -1:
+            return -2
+        deadlines = self.__deadlines[:self.__size]
+        mask = self.__liveMask() & (deadlines >= today) & (deadlines <= today + days)
+        return self.__views(self.__sortedRows(mask))
+
+
+class _TaskSnapshot:
+    """
+    Immutable, read-only view of a TaskManager published by ConcurrentTaskManager.
+    The tasks and the deadline ordering are split into shards and blocks, so a new snapshot is made from the
+    previous one by copying only the records, shards and blocks touched by the changes; everything else is shared.
+    """
+    SHARDS = 1024
+    BLOCK = 512
+
+    def __init__(self, indexes=None):
+        """
+        Builds a snapshot from a manager's indexes, copying each task record.
+
+        Parameters:
+        - indexes (tuple, optional): (sorted index entries, student index) as returned by TaskManager.getIndexes.
+          Left out by withChanges, which fills the attributes itself.
+
+        Attributes:
+        - __entries: A private list of SHARDS dictionaries (task ID -> index entry), sharded by the task ID's hash.
+        - __students: A private list of SHARDS dictionaries (student ID -> {task ID: task}), sharded the same way.
+        - __blocks: A private list of sorted lists of index entries; concatenated, they are the deadline ordering.
+        - __keys: A private list holding the (ordinal, priority, sequence) key of each block's first entry.
+        - __count: The number of tasks.
+        """
+        if indexes is None:
+            return
+        entries, student_tasks = indexes
+        self.__entries = [{} for _ in range(self.SHARDS)]
+        self.__students = [{} for _ in range(self.SHARDS)]
+        self.__blocks = []
+        self.__keys = []
+        self.__count = 0
+        block = []
+        for ordinal, priority, sequence, task in entries:
+            entry = (ordinal, priority, sequence, dict(task))
+            self.__entries[hash(task['task_id']) % self.SHARDS][task['task_id']] = entry
+            block.append(entry)
+            if len(block) == self.BLOCK:
+                self.__addBlock(block)
+                block = []
+        if block:
+            self.__addBlock(block)
+        # in the manager's per-student order (creation order), which withChanges keeps as well
+        for student_id, tasks_by_student in student_tasks.items():
+            self.__students[hash(student_id) % self.SHARDS][student_id] = {
+                task_id: self.getTaskByID(task_id) for task_id in tasks_by_student}
+
+    def __addBlock(self, block):
+        self.__blocks.append(block)
+        self.__keys.append(block[0][:3])
+        self.__count += len(block)
+
+    def withChanges(self, changes):
+        """
+        Creates the next snapshot, sharing everything the changes do not touch with this one.
+        Costs O(c * (BLOCK + log n) + n / BLOCK + SHARDS) for c changed tasks, instead of O(n) for a full copy.
+
+        Parameters:
+        - changes (dict): Task ID -> new (deadline ordinal, priority, sequence, task copy) entry, or None if deleted.
+
+        Returns:
+        - _TaskSnapshot: The new snapshot. This one is left unchanged.
+        """
+        snapshot = _TaskSnapshot()
+        entries = snapshot.__entries = list(self.__entries)
+        students = snapshot.__students = list(self.__students)
+        blocks = snapshot.__blocks = list(self.__blocks)
+        keys = snapshot.__keys = list(self.__keys)
+        count = self.__count
+        owned = set()  # ids of the shards, student maps and blocks already copied for the new snapshot
+
+        def own(container, index, copy):
+            item = container[index]
+            if id(item) not in owned:
+                item = container[index] = copy(item)
+                owned.add(id(item))
+            return item
+
+        # deletions first, then tasks in creation order, so each student's tasks stay in the manager's order
+        for task_id, entry in sorted(changes.items(), key=lambda change: -1 if change[1] is None else change[1][2]):
+            shard = own(entries, hash(task_id) % self.SHARDS, dict)
+            old = shard.pop(task_id, None)
+            if old is not None:
+                key = old[:3]
+                index = max(bisect.bisect_right(keys, key) - 1, 0)
+                block = own(blocks, index, list)
+                del block[bisect.bisect_left(block, key)]
+                if not block:
+                    del blocks[index], keys[index]
+                else:
+                    keys[index] = block[0][:3]
+                count -= 1
+                if entry is None or entry[2] != old[2]:
+                    # deleted, or deleted and created again: drop it from its student so it is re-added last
+                    student_id = old[3]['student_id']
+                    student_shard = own(students, hash(student_id) % self.SHARDS, dict)
+                    tasks_by_student = own(student_shard, student_id, dict)
+                    del tasks_by_student[task_id]
+                    if not tasks_by_student:
+                        del student_shard[student_id]
+            if entry is None:
+                continue
+            student_id = entry[3]['student_id']
+            student_shard = own(students, hash(student_id) % self.SHARDS, dict)
+            if student_id in student_shard:
+                tasks_by_student = own(student_shard, student_id, dict)
+            else:
+                tasks_by_student = student_shard[student_id] = {}
+                owned.add(id(tasks_by_student))
+            tasks_by_student[task_id] = entry[3]
+            shard[task_id] = entry
+            key = entry[:3]
+            if not blocks:
+                blocks.append([entry])
+                keys.append(key)
+                owned.add(id(blocks[0]))
+            else:
+                index = max(bisect.bisect_right(keys, key) - 1, 0)
+                block = own(blocks, index, list)
+                bisect.insort(block, entry)
+                keys[index] = block[0][:3]
+                if len(block) > 2 * self.BLOCK:
+                    halves = [block[:self.BLOCK], block[self.BLOCK:]]
+                    owned.update(id(half) for half in halves)
+                    blocks[index:index + 1] = halves
+                    keys[index:index + 1] = [half[0][:3] for half in halves]
+            count += 1
+        snapshot.__count = count
+        return snapshot
+
+    def __iterFrom(self, key=None):
+        """
+        Yields the index entries in order, starting at the first one not before key (or at the beginning).
+        """
+        blocks = self.__blocks
+        index = start = 0
+        if key is not None and blocks:
+            index = max(bisect.bisect_right(self.__keys, key) - 1, 0)
+            start = bisect.bisect_left(blocks[index], key)
+        for position in range(index, len(blocks)):
+            block = blocks[position]
+            for offset in range(start if position == index else 0, len(block)):
+                yield block[offset]
+
+    def __tasksDueBetween(self, start, end):
+        tasks = []
+        for entry in self.__iterFrom((start,)):
+            if entry[0] > end:
+                break
+            tasks.append(entry[3])
+        return tasks
+
+    def getTaskByID(self, task_id):
+        """
+        Same return values as TaskManager.getTaskByID.
+        """
+        entry = self.__entries[hash(task_id) % self.SHARDS].get(task_id)
+        return entry[3] if entry is not None else -1
+
+    def checkDeadline(self, task_id, today_date):
+        """
+        Same return values as TaskManager.checkDeadline.
+        """
+        task = self.getTaskByID(task_id)
+        if task == -1:
+            return -1
+        return task['deadline'] >= today_date
+
+    def checkPriority(self, task_id):
+        """
+        Same return values as TaskManager.checkPriority.
+        """
+        task = self.getTaskByID(task_id)
+        if task == -1:
+            return -1
+        return task['priority'] in [1, 2, 3]
+
+    def getEarliestTask(self):
+        """
+        Same return values as TaskManager.getEarliestTask.
+        """
+        if not self.__blocks:
+            return -1
+        return self.__blocks[0][0][3]
+
+    def getTasksSorted(self, reverse=False):
+        """
+        Same return value as TaskManager.getTasksSorted.
+        """
+        sorted_tasks = [entry[3] for block in self.__blocks for entry in block]
+        if reverse:
+            sorted_tasks.reverse()
+        return sorted_tasks
+
+    def getTopTasks(self, k):
+        """
+        Same return value as TaskManager.getTopTasks.
+        """
+        if k < 0:
+            return self.getTasksSorted()[:k]
+        tasks = []
+        for entry in self.__iterFrom():
+            if len(tasks) >= k:
+                break
+            tasks.append(entry[3])
+        return tasks
+
+    def getTaskByStudentID(self, student_id):
+        """
+        Same return values as TaskManager.getTaskByStudentID.
+        """
+        tasks_by_student = self.__students[hash(student_id) % self.SHARDS].get(student_id)
+        return list(tasks_by_student.values()) if tasks_by_student else -1
+
+    def countTasks(self):
+        """
+        Same return value as TaskManager.countTasks.
+        """
+        return self.__count
+
+    def getOverdueTasks(self, today_date):
+        """
+        Same return values as TaskManager.getOverdueTasks.
+        """
+        today = _dateToOrdinal(today_date)
+        if today == -1:
+            return -2
+        tasks = []
+        for entry in self.__iterFrom():
+            if entry[0] >= today:
+                break
+            tasks.append(entry[3])
+        return tasks
+
+    def getTasksDueBetween(self, start_date, end_date):
+        """
+        Same return values as TaskManager.getTasksDueBetween.
+        """
+        start = _dateToOrdinal(start_date)
+        end = _dateToOrdinal(end_date)
+        if start == -1 or end == -1:
+            return -2
+        return self.__tasksDueBetween(start, end)
+
+    def getTasksDueWithin(self, today_date, days):
+        """
+        Same return values as TaskManager.getTasksDueWithin.
+        """
+        today = _dateToOrdinal(today_date)
+        if today == -1:
+            return -2
+        return self.__tasksDueBetween(today, today + days)
+
+
+class ConcurrentTaskManager:
+    """
+    Class making practice: thread-safe front-end for TaskManager.
+    Writers take one lock; readers query an immutable snapshot without locking, so reads never wait behind writes
+    and scale across threads. The snapshot is republished lazily, by the first read after a change, by copying
+    only the changed tasks into a new snapshot that shares the rest with the old one.
+    A batch() of writes is published once, at its end. While in use, the wrapped manager should only be changed
+    through this object.
+    """
+
+    def __init__(self, manager=None):
+        """
+        Initializes the concurrent manager around a TaskManager.
+
+        Parameters:
+        - manager (TaskManager, optional): The manager to serve. Defaults to a new, empty manager.
+
+        Attributes:
+        - __manager: The wrapped TaskManager, only touched while holding __lock.
+        - __lock: A private re-entrant lock serializing writers (re-entrant so batches can call the write methods).
+        - __snapshot: The private _TaskSnapshot published for readers; replaced, never changed.
+        - __changed: A private set of the task IDs written since the snapshot was published.
+        - __rebuild: A private flag set when the whole manager was replaced (loadFromFile) since then.
+        - __stale: A private flag set once finished writes (outside any batch) are waiting to be published.
+        - __batch_depth: Nesting depth of batch() in the thread holding the lock.
+        """
+        self.__manager = manager if manager is not None else TaskManager()
+        self.__lock = threading.RLock()
+        self.__snapshot = _TaskSnapshot(self.__manager.getIndexes())
+        self.__changed = set()
+        self.__rebuild = False
+        self.__stale = False
+        self.__batch_depth = 0
+
+    def getSnapshot(self):
+        """
+        Returns a consistent, read-only view of the tasks. Use it for several reads that must agree with each other.
+        Only the first read after a change publishes a new snapshot, copying just the changed tasks under the lock;
+        other reads take no lock. A read never waits: while a writer, batch or save holds the lock, it gets the last
+        published snapshot. Nothing is published while a batch is open, not even to the thread running it.
+
+        Returns:
+        - _TaskSnapshot: The published snapshot, with the same query methods as TaskManager. It must not be modified.
+        """
+        if not self.__stale:
+            return self.__snapshot
+        if not self.__lock.acquire(blocking=False):
+            return self.__snapshot  # the lock is busy: serve the last snapshot instead of waiting
+        try:
+            if self.__stale and self.__batch_depth == 0:
+                self.__publish()
+            return self.__snapshot
+        finally:
+            self.__lock.release()
+
+    def __publish(self):
+        """
+        Replaces the snapshot with one holding the finished writes. Called with the lock held and no batch open.
+        """
+        manager = self.__manager
+        if self.__rebuild:
+            self.__snapshot = _TaskSnapshot(manager.getIndexes())
+        else:
+            changes = {}
+            for task_id in self.__changed:
+                entry = manager.getIndexEntry(task_id)
+                changes[task_id] = None if entry == -1 else entry[:3] + (dict(entry[3]),)
+            self.__snapshot = self.__snapshot.withChanges(changes)
+        self.__changed = set()
+        self.__rebuild = False
+        self.__stale = False
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Groups writes: other writers wait until the block ends and readers see all of its changes at once.
+        Reads made inside the block, including by the thread running it, still see the snapshot from before it.
+
+        Yields:
+        - ConcurrentTaskManager: This object, for calling the write methods.
+        """
+        with self.__lock:
+            self.__batch_depth += 1
+            try:
+                yield self
+            finally:
+                self.__batch_depth -= 1
+                if self.__batch_depth == 0 and (self.__changed or self.__rebuild):
+                    self.__stale = True
+
+    def __write(self, task_ids, method, *args):
+        """
+        Calls a TaskManager write method under the lock, noting the tasks it may change.
+        The change becomes visible to readers once no batch is open.
+        """
+        with self.__lock:
+            result = method(*args)
+            self.__changed.update(task_ids)
+            if self.__batch_depth == 0:
+                self.__stale = True
+        return result
+
+    def createTask(self, student_id, deadline, task_id, priority):
+        """
+        Same return values as TaskManager.createTask.
+        """
+        return self.__write((task_id,), self.__manager.createTask, student_id, deadline, task_id, priority)
+
+    def deleteTask(self, task_id):
+        """
+        Same return values as TaskManager.deleteTask.
+        """
+        return self.__write((task_id,), self.__manager.deleteTask, task_id)
+
+    def updatePriority(self, task_id, new_priority):
+        """
+        Same return values as TaskManager.updatePriority.
+        """
+        return self.__write((task_id,), self.__manager.updatePriority, task_id, new_priority)
+
+    def deferDeadline(self, task_id, delay):
+        """
+        Same return values as TaskManager.deferDeadline.
+        """
+        return self.__write((task_id,), self.__manager.deferDeadline, task_id, delay)
+
+    def deferDeadlines(self, task_ids, delay):
+        """
+        Same return values as TaskManager.deferDeadlines.
+        """
+        task_ids = list(task_ids)
+        return self.__write(task_ids, self.__manager.deferDeadlines, task_ids, delay)
+
+    def deferStudentDeadlines(self, student_id, delay):
+        """
+        Same return values as TaskManager.deferStudentDeadlines.
+        """
+        with self.__lock:
+            tasks = self.__manager.getTaskByStudentID(student_id)
+            task_ids = [task['task_id'] for task in tasks] if tasks != -1 else []
+            return self.__write(task_ids, self.__manager.deferStudentDeadlines, student_id, delay)
+
+    def deferDeadlinesBetween(self, start_date, end_date, delay):
+        """
+        Same return values as TaskManager.deferDeadlinesBetween.
+        """
+        with self.__lock:
+            tasks = self.__manager.getTasksDueBetween(start_date, end_date)
+            task_ids = [task['task_id'] for task in tasks] if tasks != -2 else []
+            return self.__write(task_ids, self.__manager.deferDeadlinesBetween, start_date, end_date, delay)
+
+    def loadFromFile(self, filename, workers=1, chunk_size=1 << 22):
+        """
+        Same return value as TaskManager.loadFromFile.
+        """
+        with self.__lock:
+            self.__rebuild = True
+            return self.__write((), self.__manager.loadFromFile, filename, workers, chunk_size)
+
+    def saveToFile(self, filename, chunk_size=10000):
+        """
+        Same as TaskManager.saveToFile. Writers wait while the file is written; readers do not.
+        """
+        with self.__lock:
+            self.__manager.saveToFile(filename, chunk_size)
+
+    def saveChanges(self, filename, compact_every=10000):
+        """
+        Same return value as TaskManager.saveChanges.
+        """
+        with self.__lock:
+            return self.__manager.saveChanges(filename, compact_every)
+
+    def hasUnsavedChanges(self):
+        """
+        Same return value as TaskManager.hasUnsavedChanges.
+        """
+        with self.__lock:
+            return self.__manager.hasUnsavedChanges()
+
+    def getTaskByID(self, task_id):
+        """
+        Same return values as TaskManager.getTaskByID, read from the current snapshot.
+        """
+        return self.getSnapshot().getTaskByID(task_id)
+
+    def checkDeadline(self, task_id, today_date):
+        """
+        Same return values as TaskManager.checkDeadline, read from the current snapshot.
+        """
+        return self.getSnapshot().checkDeadline(task_id, today_date)
+
+    def checkPriority(self, task_id):
+        """
+        Same return values as TaskManager.checkPriority, read from the current snapshot.
+        """
+        return self.getSnapshot().checkPriority(task_id)
+
+    def getEarliestTask(self):
+        """
+        Same return values as TaskManager.getEarliestTask, read from the current snapshot.
+        """
+        return self.getSnapshot().getEarliestTask()
+
+    def getTasksSorted(self, reverse=False):
+        """
+        Same return value as TaskManager.getTasksSorted, read from the current snapshot.
+        """
+        return self.getSnapshot().getTasksSorted(reverse)
+
+    def getTopTasks(self, k):
+        """
+        Same return value as TaskManager.getTopTasks, read from the current snapshot.
+        """
+        return self.getSnapshot().getTopTasks(k)
+
+    def getTaskByStudentID(self, student_id):
+        """
+        Same return values as TaskManager.getTaskByStudentID, read from the current snapshot.
+        """
+        return self.getSnapshot().getTaskByStudentID(student_id)
+
+    def countTasks(self):
+        """
+        Same return value as TaskManager.countTasks, read from the current snapshot.
+        """
+        return self.getSnapshot().countTasks()
+
+    def getOverdueTasks(self, today_date):
+        """
+        Same return values as TaskManager.getOverdueTasks, read from the current snapshot.
+        """
+        return self.getSnapshot().getOverdueTasks(today_date)
+
+    def getTasksDueBetween(self, start_date, end_date):
+        """
+        Same return values as TaskManager.getTasksDueBetween, read from the current snapshot.
+        """
+        return self.getSnapshot().getTasksDueBetween(start_date, end_date)
+
+    def getTasksDueWithin(self, today_date, days):
+        """
+        Same return values as TaskManager.getTasksDueWithin, read from the current snapshot.
         """
-        return [task for task in self.__tasks if task['deadline'] < today_date]
+        return self.getSnapshot().getTasksDueWithin(today_date, days)